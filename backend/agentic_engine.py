@@ -3,31 +3,38 @@ Agentic AI Analysis Engine for SafarAI
 Uses Emergent LLM (GPT-5.2) for intelligent analysis
 """
 import os
-import json
+import re
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from datetime import datetime, timezone, timedelta
 import uuid
+import io
+from dataclasses import dataclass, field
+from itertools import islice
+from functools import lru_cache
 
+import ijson
+import msgspec
+import orjson
+import tiktoken
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 from agentic_models import (
     ImpactScenario, DashboardWidget, ActionItem, 
-    Approval, TrendForecast, AgenticInsight
+    Approval, TrendForecast, AgenticInsight, AgenticBundle
 )
+from response_cache import cached_send, make_cache_key
 
 logger = logging.getLogger(__name__)
 
 # ========================
-# AI ANALYSIS FUNCTIONS
+# SYSTEM PROMPTS
 # ========================
+# Static instructions and output schemas only. Run-specific data goes in the
+# UserMessage so the system text is byte-identical across calls and can be
+# served from the provider's prompt-prefix cache.
 
-async def analyze_impact_scenarios(events: List[Dict], run_data: Dict) -> List[ImpactScenario]:
-    """Generate impact scenarios from events using AI"""
-    try:
-        if not events:
-            return []
-        
-        system_prompt = """You are a strategic intelligence analyst for the tourism industry.
+SYSTEM_PROMPT_IMPACT = """You are a strategic intelligence analyst for the tourism industry.
 Analyze the provided events and generate 3-5 impact scenarios.
 
 Return ONLY valid JSON array with NO markdown, NO code blocks:
@@ -42,59 +49,8 @@ Return ONLY valid JSON array with NO markdown, NO code blocks:
     "confidence_score": 0.0-1.0
   }
 ]"""
-        
-        events_summary = []
-        for e in events[:10]:  # Limit to 10 events
-            events_summary.append({
-                "company": e.get("company"),
-                "event_type": e.get("event_type"),
-                "title": e.get("title"),
-                "summary": e.get("summary")
-            })
-        
-        chat = LlmChat(
-            api_key=os.environ.get('EMERGENT_LLM_KEY', ''),
-            session_id=f"impact-{uuid.uuid4()}",
-            system_message=system_prompt
-        ).with_model("openai", "gpt-5.2")
-        
-        user_message = UserMessage(
-            text=f"Events:\n{json.dumps(events_summary, indent=2)}\n\nGenerate impact scenarios."
-        )
-        
-        response = await chat.send_message(user_message)
-        
-        # Clean response
-        response_text = response.strip()
-        if "```json" in response_text:
-            start = response_text.find("```json") + 7
-            end = response_text.find("```", start)
-            response_text = response_text[start:end].strip()
-        elif response_text.startswith("```"):
-            lines = response_text.split("\n")
-            response_text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
-        
-        # Find JSON array
-        json_start = response_text.find("[")
-        json_end = response_text.rfind("]") + 1
-        if json_start >= 0 and json_end > json_start:
-            response_text = response_text[json_start:json_end]
-        
-        scenarios_data = json.loads(response_text)
-        return [ImpactScenario(**s) for s in scenarios_data[:5]]
-        
-    except Exception as e:
-        logger.error(f"Impact analysis error: {e}")
-        return []
 
-
-async def generate_dashboard_recommendations(events: List[Dict]) -> List[DashboardWidget]:
-    """Generate dashboard widget recommendations using AI"""
-    try:
-        if not events:
-            return []
-        
-        system_prompt = """You are a data visualization expert for executive dashboards.
+SYSTEM_PROMPT_DASHBOARD = """You are a data visualization expert for executive dashboards.
 Analyze events and recommend 4-6 dashboard widgets.
 
 Return ONLY valid JSON array:
@@ -112,59 +68,8 @@ Return ONLY valid JSON array:
     }
   }
 ]"""
-        
-        event_types = {}
-        for e in events:
-            et = e.get("event_type", "other")
-            event_types[et] = event_types.get(et, 0) + 1
-        
-        chat = LlmChat(
-            api_key=os.environ.get('EMERGENT_LLM_KEY', ''),
-            session_id=f"dashboard-{uuid.uuid4()}",
-            system_message=system_prompt
-        ).with_model("openai", "gpt-5.2")
-        
-        user_message = UserMessage(
-            text=f"Event distribution: {json.dumps(event_types)}\nTotal events: {len(events)}\n\nRecommend dashboard widgets."
-        )
-        
-        response = await chat.send_message(user_message)
-        
-        # Clean response
-        response_text = response.strip()
-        if "```json" in response_text:
-            start = response_text.find("```json") + 7
-            end = response_text.find("```", start)
-            response_text = response_text[start:end].strip()
-        
-        json_start = response_text.find("[")
-        json_end = response_text.rfind("]") + 1
-        if json_start >= 0 and json_end > json_start:
-            response_text = response_text[json_start:json_end]
-        
-        widgets_data = json.loads(response_text)
-        return [DashboardWidget(**w) for w in widgets_data[:6]]
-        
-    except Exception as e:
-        logger.error(f"Dashboard recommendation error: {e}")
-        return []
-
 
-async def generate_action_items(events: List[Dict], run_id: str, team_members: List[Dict]) -> List[ActionItem]:
-    """Generate prioritized action items with AI-based role assignment"""
-    try:
-        if not events:
-            return []
-        
-        # Create role mapping
-        role_map = {}
-        for member in team_members:
-            role = member.get("role_type", "analyst")
-            if role not in role_map:
-                role_map[role] = []
-            role_map[role].append(member)
-        
-        system_prompt = """You are a task management AI for tourism intelligence.
+SYSTEM_PROMPT_ACTION_ITEMS = """You are a task management AI for tourism intelligence.
 Generate 5-10 prioritized action items based on events.
 
 Assign tasks to roles: analyst, executive, marketing, risk
@@ -181,80 +86,8 @@ Return ONLY valid JSON array:
     "related_events": ["event_id1", "event_id2"]
   }
 ]"""
-        
-        events_for_tasks = []
-        for e in events[:15]:
-            events_for_tasks.append({
-                "id": e.get("id"),
-                "company": e.get("company"),
-                "event_type": e.get("event_type"),
-                "title": e.get("title"),
-                "why_it_matters": e.get("why_it_matters")
-            })
-        
-        chat = LlmChat(
-            api_key=os.environ.get('EMERGENT_LLM_KEY', ''),
-            session_id=f"tasks-{uuid.uuid4()}",
-            system_message=system_prompt
-        ).with_model("openai", "gpt-5.2")
-        
-        user_message = UserMessage(
-            text=f"Events:\n{json.dumps(events_for_tasks, indent=2)}\n\nAvailable roles: {list(role_map.keys())}\n\nGenerate action items."
-        )
-        
-        response = await chat.send_message(user_message)
-        
-        # Clean response
-        response_text = response.strip()
-        if "```json" in response_text:
-            start = response_text.find("```json") + 7
-            end = response_text.find("```", start)
-            response_text = response_text[start:end].strip()
-        
-        json_start = response_text.find("[")
-        json_end = response_text.rfind("]") + 1
-        if json_start >= 0 and json_end > json_start:
-            response_text = response_text[json_start:json_end]
-        
-        tasks_data = json.loads(response_text)
-        
-        # Create action items and auto-assign to team members
-        action_items = []
-        for task in tasks_data[:10]:
-            assigned_role = task.get("assigned_role", "analyst")
-            assigned_to = None
-            
-            # Round-robin assignment within role
-            if assigned_role in role_map and role_map[assigned_role]:
-                assigned_to = role_map[assigned_role][len(action_items) % len(role_map[assigned_role])].get("id")
-            
-            action_item = ActionItem(
-                run_id=run_id,
-                title=task.get("title", ""),
-                description=task.get("description", ""),
-                priority=task.get("priority", "P2"),
-                assigned_role=assigned_role,
-                assigned_to=assigned_to,
-                due_date=task.get("due_date"),
-                reasoning=task.get("reasoning", ""),
-                related_events=task.get("related_events", [])
-            )
-            action_items.append(action_item)
-        
-        return action_items
-        
-    except Exception as e:
-        logger.error(f"Action items generation error: {e}")
-        return []
 
-
-async def generate_approvals(events: List[Dict], run_id: str, run_data: Dict) -> List[Approval]:
-    """Generate approval suggestions for executable actions"""
-    try:
-        if not events:
-            return []
-        
-        system_prompt = """You are an automation advisor for intelligence platforms.
+SYSTEM_PROMPT_APPROVALS = """You are an automation advisor for intelligence platforms.
 Suggest 3-5 executable actions that require approval.
 
 Action types: send_email, add_source, schedule_monitoring, export_csv, send_alert
@@ -272,147 +105,578 @@ Return ONLY valid JSON array:
     }
   }
 ]"""
+
+SYSTEM_PROMPT_TRENDS = """You are a tourism industry trend analyst with predictive capabilities.
+Analyze events and forecast 3-5 emerging trends.
+
+Categories: partnerships, funding, pricing, technology, destinations
+
+Return ONLY valid JSON array:
+[
+  {
+    "trend_category": "partnerships|funding|pricing|technology|destinations",
+    "trend_name": "trend name",
+    "description": "detailed trend description",
+    "forecast_horizon": "next_quarter|next_6_months|next_year",
+    "confidence": 0.0-1.0,
+    "supporting_events": ["event_id1"],
+    "key_indicators": ["indicator 1", "indicator 2"],
+    "potential_impact": "impact description",
+    "recommended_actions": ["action 1", "action 2"]
+  }
+]"""
+
+SYSTEM_PROMPT_BUNDLED = """You are a strategic intelligence AI for the tourism industry.
+Analyze the provided events and produce five sections in one response.
+
+1. impact_scenarios: 3-5 impact scenarios
+2. dashboard_widgets: 4-6 executive dashboard widgets
+3. action_items: 5-10 prioritized tasks assigned to roles: analyst, executive, marketing, risk
+4. approvals: 3-5 executable actions that require approval.
+   Action types: send_email, add_source, schedule_monitoring, export_csv, send_alert
+5. trend_forecasts: 3-5 emerging trends (empty array if fewer than 3 events).
+   Categories: partnerships, funding, pricing, technology, destinations
+
+Return ONLY a valid JSON object with NO markdown, NO code blocks:
+{
+  "impact_scenarios": [
+    {
+      "scenario_name": "string",
+      "description": "detailed scenario description",
+      "probability": 0.0-1.0,
+      "impact_level": "low|medium|high|critical",
+      "assumptions": ["assumption 1", "assumption 2"],
+      "potential_outcomes": ["outcome 1", "outcome 2"],
+      "confidence_score": 0.0-1.0
+    }
+  ],
+  "dashboard_widgets": [
+    {
+      "widget_type": "chart|metric|table|alert",
+      "title": "widget title",
+      "description": "what this widget shows",
+      "data_source": "data source description",
+      "priority": "P0|P1|P2",
+      "template": {
+        "chart_type": "line|bar|pie|gauge",
+        "metrics": ["metric1", "metric2"],
+        "filters": ["filter1"]
+      }
+    }
+  ],
+  "action_items": [
+    {
+      "title": "task title",
+      "description": "detailed description",
+      "priority": "P0|P1|P2",
+      "assigned_role": "analyst|executive|marketing|risk",
+      "due_date": "YYYY-MM-DD",
+      "reasoning": "why this task matters",
+      "related_events": ["event_id1", "event_id2"]
+    }
+  ],
+  "approvals": [
+    {
+      "action_type": "send_email|add_source|schedule_monitoring|export_csv|send_alert",
+      "title": "action title",
+      "description": "what this action does",
+      "reasoning": "why recommend this",
+      "confidence": 0.0-1.0,
+      "parameters": {
+        "key": "value"
+      }
+    }
+  ],
+  "trend_forecasts": [
+    {
+      "trend_category": "partnerships|funding|pricing|technology|destinations",
+      "trend_name": "trend name",
+      "description": "detailed trend description",
+      "forecast_horizon": "next_quarter|next_6_months|next_year",
+      "confidence": 0.0-1.0,
+      "supporting_events": ["event_id1"],
+      "key_indicators": ["indicator 1", "indicator 2"],
+      "potential_impact": "impact description",
+      "recommended_actions": ["action 1", "action 2"]
+    }
+  ]
+}"""
+
+# ========================
+# LLM CLIENT
+# ========================
+
+LLM_PROVIDER = "openai"
+LLM_MODEL = "gpt-5.2"
+
+
+# Structured Outputs schema for the bundled analysis
+BUNDLED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "agentic_bundle",
+        "schema": msgspec.json.schema(AgenticBundle),
+        "strict": False
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def _warn_no_response_format():
+    # Permanent for the installed LlmChat version, so logged once per process
+    logger.warning("LlmChat does not support response_format; relying on prompt instructions")
+
+
+def new_chat(session_prefix: str, system_message: str, response_format: Optional[Dict] = None) -> LlmChat:
+    """Create a chat session with the shared provider/model configuration"""
+    chat = LlmChat(
+        api_key=os.environ.get('EMERGENT_LLM_KEY', ''),
+        session_id=f"{session_prefix}-{uuid.uuid4()}",
+        system_message=system_message
+    ).with_model(LLM_PROVIDER, LLM_MODEL)
+    
+    if response_format is not None:
+        if hasattr(chat, "with_params"):
+            chat = chat.with_params(response_format=response_format)
+        else:
+            _warn_no_response_format()
+    
+    return chat
+
+
+LLM_TIMEOUT_SECONDS = 45
+LLM_RETRIES = 1
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and status_code >= 500
+
+
+async def robust_send(chat: LlmChat, user_message: UserMessage, *, timeout: float = LLM_TIMEOUT_SECONDS, retries: int = LLM_RETRIES) -> str:
+    """Send a message with a per-attempt timeout, retrying timeouts and 5xx errors with backoff"""
+    for attempt in range(retries + 1):
+        try:
+            return await asyncio.wait_for(chat.send_message(user_message), timeout=timeout)
+        except Exception as e:
+            if attempt == retries or not _is_retryable(e):
+                raise
+            delay = 2 ** attempt
+            logger.warning(f"LLM call failed ({type(e).__name__}), retrying in {delay}s")
+            await asyncio.sleep(delay)
+
+
+# ========================
+# EVENT CONTEXT
+# ========================
+
+COMPACT_EVENT_FIELDS = ("id", "company", "event_type", "title", "summary", "why_it_matters", "key_entities")
+
+# Prompt token budget for the event payload shared by every stage
+EVENT_TOKEN_BUDGET = 4000
+
+
+@lru_cache(maxsize=1)
+def _token_encoder():
+    try:
+        return tiktoken.encoding_for_model("gpt-4o")
+    except Exception as e:
+        logger.warning(f"tiktoken encoder unavailable, estimating tokens from length: {e}")
+        return None
+
+
+async def warm_token_encoder():
+    """Load the tiktoken encoder off the event loop; the first load may download its BPE file"""
+    await asyncio.to_thread(_token_encoder)
+
+
+def count_tokens(text: str) -> int:
+    """Count prompt tokens, falling back to a ~4 chars/token estimate"""
+    encoder = _token_encoder()
+    if encoder is None:
+        return len(text) // 4 + 1
+    return len(encoder.encode(text))
+
+
+def select_events_by_budget(compact_events: List[Dict], scores: List[int], budget: int = EVENT_TOKEN_BUDGET) -> List[Dict]:
+    """Greedily pick the most material events whose serialized size fits the token budget"""
+    order = sorted(range(len(compact_events)), key=lambda i: scores[i], reverse=True)
+    
+    selected = []
+    used = 0
+    for i in order:
+        tokens = count_tokens(dumps_compact(compact_events[i]))
+        if selected and used + tokens > budget:
+            continue
+        selected.append(compact_events[i])
+        used += tokens
+        if used >= budget:
+            break
+    
+    return selected
+
+
+@dataclass
+class EventContext:
+    """Normalized view of a run's events, built once and shared by every analysis stage"""
+    # Most material events first, capped at EVENT_TOKEN_BUDGET
+    compact_events: List[Dict] = field(default_factory=list)
+    event_type_counts: Dict[str, int] = field(default_factory=dict)
+    event_types: List[str] = field(default_factory=list)
+    high_priority_count: int = 0
+    total_events: int = 0
+
+
+def build_event_context(events: List[Dict]) -> EventContext:
+    """Walk the events once to produce the payloads and summaries the prompts need"""
+    compact_events = []
+    scores = []
+    event_type_counts = {}
+    high_priority_count = 0
+    
+    for e in events:
+        compact_events.append({k: e.get(k) for k in COMPACT_EVENT_FIELDS})
+        score = e.get("materiality_score", 0) or 0
+        scores.append(score)
+        et = e.get("event_type", "other")
+        event_type_counts[et] = event_type_counts.get(et, 0) + 1
+        if score >= 70:
+            high_priority_count += 1
+    
+    return EventContext(
+        compact_events=select_events_by_budget(compact_events, scores),
+        event_type_counts=event_type_counts,
+        event_types=list(event_type_counts.keys()),
+        high_priority_count=high_priority_count,
+        total_events=len(events)
+    )
+
+
+# ========================
+# RESPONSE PARSING
+# ========================
+
+def dumps_compact(obj: Any) -> str:
+    """Serialize a prompt payload as compact JSON (the model does not need indentation)"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def extract_json_array(text: str) -> str:
+    """Return the outermost JSON array in an LLM response, ignoring fences and prose"""
+    m = _JSON_ARRAY_RE.search(text)
+    return m.group(0) if m else '[]'
+
+
+def extract_json_object(text: str) -> str:
+    """Return the outermost JSON object in an LLM response, ignoring fences and prose"""
+    m = _JSON_OBJECT_RE.search(text)
+    return m.group(0) if m else '{}'
+
+
+def iter_json_array(text: str, limit: Optional[int] = None) -> Iterator[Dict]:
+    """Incrementally yield the elements of a top-level JSON array, stopping after limit items"""
+    items = ijson.items(io.BytesIO(text.encode()), "item", use_float=True)
+    return islice(items, limit) if limit is not None else items
+
+
+# ========================
+# RECORD BUILDERS
+# ========================
+
+def build_role_map(team_members: List[Dict]) -> Dict[str, List[Dict]]:
+    """Group team members by role type"""
+    role_map = {}
+    for member in team_members:
+        role = member.get("role_type", "analyst")
+        if role not in role_map:
+            role_map[role] = []
+        role_map[role].append(member)
+    return role_map
+
+
+def build_action_items(tasks_data: List[Dict], run_id: str, role_map: Dict[str, List[Dict]]) -> List[ActionItem]:
+    """Create action items and auto-assign them to team members"""
+    action_items = []
+    for task in tasks_data[:10]:
+        assigned_role = task.get("assigned_role", "analyst")
+        assigned_to = None
+        
+        # Round-robin assignment within role
+        if assigned_role in role_map and role_map[assigned_role]:
+            assigned_to = role_map[assigned_role][len(action_items) % len(role_map[assigned_role])].get("id")
+        
+        action_item = msgspec.convert({
+            "run_id": run_id,
+            "title": task.get("title", ""),
+            "description": task.get("description", ""),
+            "priority": task.get("priority", "P2"),
+            "assigned_role": assigned_role,
+            "assigned_to": assigned_to,
+            "due_date": task.get("due_date"),
+            "reasoning": task.get("reasoning", ""),
+            "related_events": task.get("related_events", [])
+        }, ActionItem, strict=False)
+        action_items.append(action_item)
+    
+    return action_items
+
+
+def build_approvals(approvals_data: List[Dict], run_id: str) -> List[Approval]:
+    """Create approval requests from model suggestions"""
+    approvals = []
+    for approval in approvals_data[:5]:
+        approvals.append(msgspec.convert({
+            "run_id": run_id,
+            "action_type": approval.get("action_type", "send_alert"),
+            "title": approval.get("title", ""),
+            "description": approval.get("description", ""),
+            "reasoning": approval.get("reasoning", ""),
+            "confidence": approval.get("confidence", 0.5),
+            "parameters": approval.get("parameters", {})
+        }, Approval, strict=False))
+    
+    return approvals
+
+
+def build_trend_forecasts(trends_data: List[Dict], run_id: str) -> List[TrendForecast]:
+    """Create trend forecasts from model predictions"""
+    forecasts = []
+    for trend in trends_data[:5]:
+        forecasts.append(msgspec.convert({
+            "run_id": run_id,
+            "trend_category": trend.get("trend_category", "partnerships"),
+            "trend_name": trend.get("trend_name", ""),
+            "description": trend.get("description", ""),
+            "forecast_horizon": trend.get("forecast_horizon", "next_quarter"),
+            "confidence": trend.get("confidence", 0.5),
+            "supporting_events": trend.get("supporting_events", []),
+            "key_indicators": trend.get("key_indicators", []),
+            "potential_impact": trend.get("potential_impact", ""),
+            "recommended_actions": trend.get("recommended_actions", [])
+        }, TrendForecast, strict=False))
+    
+    return forecasts
+
+
+# ========================
+# AI ANALYSIS FUNCTIONS
+# ========================
+
+async def analyze_impact_scenarios(ctx: EventContext, run_data: Dict) -> List[ImpactScenario]:
+    """Generate impact scenarios from events using AI"""
+    try:
+        if not ctx.compact_events:
+            return []
         
-        summary = {
-            "events_created": len(events),
-            "high_priority": len([e for e in events if e.get("materiality_score", 0) >= 70]),
-            "event_types": list(set([e.get("event_type") for e in events]))
-        }
+        events_summary = ctx.compact_events
+        
+        chat = new_chat("impact", SYSTEM_PROMPT_IMPACT)
+        
+        user_message = UserMessage(
+            text=f"Events:\n{dumps_compact(events_summary)}\n\nGenerate impact scenarios."
+        )
         
-        chat = LlmChat(
-            api_key=os.environ.get('EMERGENT_LLM_KEY', ''),
-            session_id=f"approvals-{uuid.uuid4()}",
-            system_message=system_prompt
-        ).with_model("openai", "gpt-5.2")
+        cache_key = make_cache_key(SYSTEM_PROMPT_IMPACT, user_message.text)
+        return await cached_send(
+            chat, user_message, cache_key, send=robust_send,
+            parse=lambda response: [
+                msgspec.convert(s, ImpactScenario, strict=False)
+                for s in iter_json_array(extract_json_array(response), limit=5)
+            ]
+        )
+        
+    except Exception as e:
+        logger.error(f"Impact analysis error: {e}")
+        return []
+
+
+async def generate_dashboard_recommendations(ctx: EventContext) -> List[DashboardWidget]:
+    """Generate dashboard widget recommendations using AI"""
+    try:
+        if not ctx.compact_events:
+            return []
+        
+        chat = new_chat("dashboard", SYSTEM_PROMPT_DASHBOARD)
         
         user_message = UserMessage(
-            text=f"Run summary:\n{json.dumps(summary, indent=2)}\n\nSuggest approval actions."
+            text=f"Event distribution: {dumps_compact(ctx.event_type_counts)}\nTotal events: {ctx.total_events}\n\nRecommend dashboard widgets."
         )
         
-        response = await chat.send_message(user_message)
+        cache_key = make_cache_key(SYSTEM_PROMPT_DASHBOARD, user_message.text)
+        return await cached_send(
+            chat, user_message, cache_key, send=robust_send,
+            parse=lambda response: [
+                msgspec.convert(w, DashboardWidget, strict=False)
+                for w in iter_json_array(extract_json_array(response), limit=6)
+            ]
+        )
         
-        # Clean response
-        response_text = response.strip()
-        if "```json" in response_text:
-            start = response_text.find("```json") + 7
-            end = response_text.find("```", start)
-            response_text = response_text[start:end].strip()
+    except Exception as e:
+        logger.error(f"Dashboard recommendation error: {e}")
+        return []
+
+
+async def generate_action_items(ctx: EventContext, run_id: str, team_members: List[Dict]) -> List[ActionItem]:
+    """Generate prioritized action items with AI-based role assignment"""
+    try:
+        if not ctx.compact_events:
+            return []
         
-        json_start = response_text.find("[")
-        json_end = response_text.rfind("]") + 1
-        if json_start >= 0 and json_end > json_start:
-            response_text = response_text[json_start:json_end]
+        role_map = build_role_map(team_members)
+        events_for_tasks = ctx.compact_events
         
-        approvals_data = json.loads(response_text)
+        chat = new_chat("tasks", SYSTEM_PROMPT_ACTION_ITEMS)
         
-        approvals = []
-        for approval in approvals_data[:5]:
-            approvals.append(Approval(
-                run_id=run_id,
-                action_type=approval.get("action_type", "send_alert"),
-                title=approval.get("title", ""),
-                description=approval.get("description", ""),
-                reasoning=approval.get("reasoning", ""),
-                confidence=approval.get("confidence", 0.5),
-                parameters=approval.get("parameters", {})
-            ))
+        user_message = UserMessage(
+            text=f"Events:\n{dumps_compact(events_for_tasks)}\n\nAvailable roles: {list(role_map.keys())}\n\nGenerate action items."
+        )
         
-        return approvals
+        cache_key = make_cache_key(SYSTEM_PROMPT_ACTION_ITEMS, user_message.text)
+        return await cached_send(
+            chat, user_message, cache_key, send=robust_send,
+            parse=lambda response: build_action_items(
+                list(iter_json_array(extract_json_array(response), limit=10)), run_id, role_map
+            )
+        )
         
     except Exception as e:
-        logger.error(f"Approvals generation error: {e}")
+        logger.error(f"Action items generation error: {e}")
         return []
 
 
-async def forecast_trends(events: List[Dict], run_id: str) -> List[TrendForecast]:
-    """Predict tourism trends using event patterns"""
+async def generate_approvals(ctx: EventContext, run_id: str, run_data: Dict) -> List[Approval]:
+    """Generate approval suggestions for executable actions"""
     try:
-        if not events or len(events) < 3:
+        if not ctx.compact_events:
             return []
         
-        system_prompt = """You are a tourism industry trend analyst with predictive capabilities.
-Analyze events and forecast 3-5 emerging trends.
+        summary = {
+            "events_created": ctx.total_events,
+            "high_priority": ctx.high_priority_count,
+            "event_types": ctx.event_types
+        }
+        
+        chat = new_chat("approvals", SYSTEM_PROMPT_APPROVALS)
+        
+        user_message = UserMessage(
+            text=f"Run summary:\n{dumps_compact(summary)}\n\nSuggest approval actions."
+        )
+        
+        cache_key = make_cache_key(SYSTEM_PROMPT_APPROVALS, user_message.text)
+        return await cached_send(
+            chat, user_message, cache_key, send=robust_send,
+            parse=lambda response: build_approvals(
+                list(iter_json_array(extract_json_array(response), limit=5)), run_id
+            )
+        )
+        
+    except Exception as e:
+        logger.error(f"Approvals generation error: {e}")
+        return []
 
-Categories: partnerships, funding, pricing, technology, destinations
 
-Return ONLY valid JSON array:
-[
-  {
-    "trend_category": "partnerships|funding|pricing|technology|destinations",
-    "trend_name": "trend name",
-    "description": "detailed trend description",
-    "forecast_horizon": "next_quarter|next_6_months|next_year",
-    "confidence": 0.0-1.0,
-    "supporting_events": ["event_id1"],
-    "key_indicators": ["indicator 1", "indicator 2"],
-    "potential_impact": "impact description",
-    "recommended_actions": ["action 1", "action 2"]
-  }
-]"""
+async def forecast_trends(ctx: EventContext, run_id: str) -> List[TrendForecast]:
+    """Predict tourism trends using event patterns"""
+    try:
+        if ctx.total_events < 3:
+            return []
         
-        events_for_forecast = []
-        for e in events:
-            events_for_forecast.append({
-                "id": e.get("id"),
-                "company": e.get("company"),
-                "event_type": e.get("event_type"),
-                "title": e.get("title"),
-                "summary": e.get("summary"),
-                "key_entities": e.get("key_entities", {})
-            })
-        
-        chat = LlmChat(
-            api_key=os.environ.get('EMERGENT_LLM_KEY', ''),
-            session_id=f"trends-{uuid.uuid4()}",
-            system_message=system_prompt
-        ).with_model("openai", "gpt-5.2")
+        events_for_forecast = ctx.compact_events
+        
+        chat = new_chat("trends", SYSTEM_PROMPT_TRENDS)
         
         user_message = UserMessage(
-            text=f"Historical events:\n{json.dumps(events_for_forecast, indent=2)}\n\nForecast emerging trends."
+            text=f"Historical events:\n{dumps_compact(events_for_forecast)}\n\nForecast emerging trends."
         )
         
-        response = await chat.send_message(user_message)
-        
-        # Clean response
-        response_text = response.strip()
-        if "```json" in response_text:
-            start = response_text.find("```json") + 7
-            end = response_text.find("```", start)
-            response_text = response_text[start:end].strip()
-        
-        json_start = response_text.find("[")
-        json_end = response_text.rfind("]") + 1
-        if json_start >= 0 and json_end > json_start:
-            response_text = response_text[json_start:json_end]
-        
-        trends_data = json.loads(response_text)
-        
-        forecasts = []
-        for trend in trends_data[:5]:
-            forecasts.append(TrendForecast(
-                run_id=run_id,
-                trend_category=trend.get("trend_category", "partnerships"),
-                trend_name=trend.get("trend_name", ""),
-                description=trend.get("description", ""),
-                forecast_horizon=trend.get("forecast_horizon", "next_quarter"),
-                confidence=trend.get("confidence", 0.5),
-                supporting_events=trend.get("supporting_events", []),
-                key_indicators=trend.get("key_indicators", []),
-                potential_impact=trend.get("potential_impact", ""),
-                recommended_actions=trend.get("recommended_actions", [])
-            ))
-        
-        return forecasts
+        cache_key = make_cache_key(SYSTEM_PROMPT_TRENDS, user_message.text)
+        return await cached_send(
+            chat, user_message, cache_key, send=robust_send,
+            parse=lambda response: build_trend_forecasts(
+                list(iter_json_array(extract_json_array(response), limit=5)), run_id
+            )
+        )
         
     except Exception as e:
         logger.error(f"Trend forecasting error: {e}")
         return []
 
 
+# ========================
+# BUNDLED ANALYSIS
+# ========================
+
+async def analyze_run_bundled(
+    ctx: EventContext,
+    run_id: str,
+    run_data: Dict,
+    team_members: List[Dict]
+) -> Optional[Tuple[List[ImpactScenario], List[DashboardWidget], List[ActionItem], List[Approval], List[TrendForecast]]]:
+    """
+    Generate all five analyses from a single LLM request.
+    Returns None if the bundled response cannot be used, so callers can
+    fall back to the per-stage helpers.
+    """
+    try:
+        if not ctx.compact_events:
+            return [], [], [], [], []
+        
+        role_map = build_role_map(team_members)
+        events_payload = ctx.compact_events
+        
+        summary = {
+            "events_created": ctx.total_events,
+            "high_priority": ctx.high_priority_count,
+            "event_types": ctx.event_type_counts
+        }
+        
+        chat = new_chat("bundle", SYSTEM_PROMPT_BUNDLED, response_format=BUNDLED_RESPONSE_FORMAT)
+        
+        user_message = UserMessage(
+            text=f"Events:\n{dumps_compact(events_payload)}\n\nRun summary:\n{dumps_compact(summary)}\n\nAvailable roles: {list(role_map.keys())}\n\nGenerate all five sections."
+        )
+        
+        def parse_bundle(response: str):
+            # Structured Outputs returns bare JSON; only dig it out of surrounding
+            # text if the provider ignored the response format
+            try:
+                bundle = orjson.loads(response)
+            except orjson.JSONDecodeError:
+                bundle = orjson.loads(extract_json_object(response))
+            if not isinstance(bundle, dict) or not bundle:
+                raise ValueError("bundled response is not a non-empty JSON object")
+            
+            impact_scenarios = [msgspec.convert(s, ImpactScenario, strict=False) for s in (bundle.get("impact_scenarios") or [])[:5]]
+            dashboard_widgets = [msgspec.convert(w, DashboardWidget, strict=False) for w in (bundle.get("dashboard_widgets") or [])[:6]]
+            action_items = build_action_items(bundle.get("action_items") or [], run_id, role_map)
+            approvals = build_approvals(bundle.get("approvals") or [], run_id)
+            trend_forecasts = []
+            if ctx.total_events >= 3:
+                trend_forecasts = build_trend_forecasts(bundle.get("trend_forecasts") or [], run_id)
+            return impact_scenarios, dashboard_widgets, action_items, approvals, trend_forecasts
+        
+        cache_key = make_cache_key(SYSTEM_PROMPT_BUNDLED, user_message.text)
+        return await cached_send(chat, user_message, cache_key, send=robust_send, parse=parse_bundle)
+        
+    except Exception as e:
+        logger.error(f"Bundled analysis error: {e}")
+        return None
+
+
 # ========================
 # MAIN ORCHESTRATION
 # ========================
 
+_RISK_LEVELS = frozenset({"high", "critical"})
+_OPPORTUNITY_RE = re.compile(r"opportunity", re.IGNORECASE)
+
+
 async def generate_agentic_insights(
     run_id: str, 
     events: List[Dict], 
@@ -425,15 +689,49 @@ async def generate_agentic_insights(
     Returns insight_id if successful
     """
     try:
+        if not events:
+            logger.info(f"Run {run_id} has no events, skipping agentic analysis")
+            return None
+        
         start_time = datetime.now(timezone.utc)
         logger.info(f"Starting agentic analysis for run {run_id}")
         
-        # Generate all insights in parallel would be ideal, but for simplicity we'll do sequential
-        impact_scenarios = await analyze_impact_scenarios(events, run_data)
-        dashboard_widgets = await generate_dashboard_recommendations(events)
-        action_items = await generate_action_items(events, run_id, team_members)
-        approvals = await generate_approvals(events, run_id, run_data)
-        trend_forecasts = await forecast_trends(events, run_id)
+        # One bundled request covers all five analyses; fall back to the
+        # per-stage helpers (run concurrently) if it cannot be parsed.
+        # Token counting is CPU work and may still trigger the encoder load, so it runs in a thread.
+        ctx = await asyncio.to_thread(build_event_context, events)
+        
+        results = await analyze_run_bundled(ctx, run_id, run_data, team_members)
+        
+        if results is None:
+            logger.info(f"Falling back to per-stage analysis for run {run_id}")
+            
+            # Only schedule the stages that can produce output for this run
+            stages = {
+                "impact_scenarios": lambda: analyze_impact_scenarios(ctx, run_data),
+                "dashboard_widgets": lambda: generate_dashboard_recommendations(ctx),
+                "action_items": lambda: generate_action_items(ctx, run_id, team_members),
+                "approvals": lambda: generate_approvals(ctx, run_id, run_data),
+                "trend_forecasts": lambda: forecast_trends(ctx, run_id),
+            }
+            enabled = {name: True for name in stages}
+            enabled["trend_forecasts"] = ctx.total_events >= 3
+            
+            scheduled = [name for name in stages if enabled[name]]
+            outputs = await asyncio.gather(
+                *(stages[name]() for name in scheduled),
+                return_exceptions=True
+            )
+            
+            stage_results = {name: [] for name in stages}
+            for name, result in zip(scheduled, outputs):
+                if isinstance(result, BaseException):
+                    logger.error(f"Agentic stage {name} failed for run {run_id}: {result}")
+                else:
+                    stage_results[name] = result
+            results = list(stage_results.values())
+        
+        impact_scenarios, dashboard_widgets, action_items, approvals, trend_forecasts = results
         
         # Extract key findings
         key_findings = []
@@ -441,10 +739,10 @@ async def generate_agentic_insights(
             key_findings.append(f"{scenario.scenario_name}: {scenario.description[:100]}...")
         
         # Extract risk alerts
-        risk_alerts = [s.scenario_name for s in impact_scenarios if s.impact_level in ["high", "critical"]]
+        risk_alerts = [s.scenario_name for s in impact_scenarios if s.impact_level in _RISK_LEVELS]
         
         # Extract opportunities
-        opportunities = [s.scenario_name for s in impact_scenarios if "opportunity" in s.description.lower()]
+        opportunities = [s.scenario_name for s in impact_scenarios if _OPPORTUNITY_RE.search(s.description)]
         
         # Create trend summary
         trend_summary = f"Identified {len(trend_forecasts)} emerging trends across {len(set([t.trend_category for t in trend_forecasts]))} categories"
@@ -464,39 +762,30 @@ async def generate_agentic_insights(
         )
         
         # Store in database
-        insight_doc = insight.model_dump()
-        insight_doc['generated_at'] = insight_doc['generated_at'].isoformat()
-        
-        # Convert nested models to dicts
-        insight_doc['impact_scenarios'] = [s.model_dump() for s in impact_scenarios]
-        insight_doc['dashboard_recommendations'] = [w.model_dump() for w in dashboard_widgets]
-        
-        await db.agentic_insights.insert_one(insight_doc)
-        
-        # Store action items
-        for item in action_items:
-            item_doc = item.model_dump()
-            item_doc['created_at'] = item_doc['created_at'].isoformat()
-            await db.action_items.insert_one(item_doc)
-        
-        # Store approvals
-        for approval in approvals:
-            approval_doc = approval.model_dump()
-            approval_doc['created_at'] = approval_doc['created_at'].isoformat()
-            await db.approvals.insert_one(approval_doc)
-        
-        # Store trend forecasts
-        for forecast in trend_forecasts:
-            forecast_doc = forecast.model_dump()
-            forecast_doc['created_at'] = forecast_doc['created_at'].isoformat()
-            await db.trend_forecasts.insert_one(forecast_doc)
+        insight_doc = msgspec.to_builtins(insight)
+        
+        # Store action items, approvals and trend forecasts in one batch per collection.
+        # Action item and approval timestamps stay datetimes so Motor writes BSON dates,
+        # matching the completed_at/approved_at/executed_at values the endpoints set.
+        action_items_docs = [msgspec.to_builtins(item, builtin_types=(datetime,)) for item in action_items]
+        approvals_docs = [msgspec.to_builtins(approval, builtin_types=(datetime,)) for approval in approvals]
+        forecast_docs = [msgspec.to_builtins(forecast) for forecast in trend_forecasts]
+        
+        # The writes are independent, so issue them concurrently
+        writes = [db.agentic_insights.insert_one(insight_doc)]
+        if action_items_docs:
+            writes.append(db.action_items.insert_many(action_items_docs, ordered=False))
+        if approvals_docs:
+            writes.append(db.approvals.insert_many(approvals_docs, ordered=False))
+        if forecast_docs:
+            writes.append(db.trend_forecasts.insert_many(forecast_docs, ordered=False))
+        
+        await asyncio.gather(*writes)
         
         logger.info(f"Agentic analysis complete for run {run_id}: {len(action_items)} tasks, {len(approvals)} approvals, {len(trend_forecasts)} trends")
         
         return insight.id
         
-    except Exception as e:
-        logger.error(f"Agentic insights generation error: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Agentic insights generation error for run %s", run_id)
         return None
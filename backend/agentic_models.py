@@ -1,12 +1,25 @@
 """
 Agentic AI Models for SafarAI Intelligence Platform
 Additive module - does not modify existing schemas
+
+Request/response models used by the API stay on Pydantic; the records the
+agentic engine generates in bulk are msgspec Structs.
 """
 from pydantic import BaseModel, Field
+import msgspec
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 import uuid
 
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 # ========================
 # TEAM MANAGEMENT
 # ========================
@@ -30,7 +43,7 @@ class TeamMemberCreate(BaseModel):
 # IMPACT ANALYSIS
 # ========================
 
-class ImpactScenario(BaseModel):
+class ImpactScenario(msgspec.Struct, kw_only=True):
     scenario_name: str
     description: str
     probability: float  # 0-1
@@ -39,7 +52,7 @@ class ImpactScenario(BaseModel):
     potential_outcomes: List[str]
     confidence_score: float  # 0-1
 
-class DashboardWidget(BaseModel):
+class DashboardWidget(msgspec.Struct, kw_only=True):
     widget_type: str  # chart, metric, table, alert
     title: str
     description: str
@@ -51,8 +64,8 @@ class DashboardWidget(BaseModel):
 # ACTION ITEMS
 # ========================
 
-class ActionItem(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class ActionItem(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=_new_id)
     run_id: str
     title: str
     description: str
@@ -63,7 +76,7 @@ class ActionItem(BaseModel):
     status: str = "pending"  # pending, in_progress, completed, cancelled
     reasoning: str
     related_events: List[str] = []
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = msgspec.field(default_factory=_utc_now)
     completed_at: Optional[datetime] = None
 
 class ActionItemUpdate(BaseModel):
@@ -74,8 +87,8 @@ class ActionItemUpdate(BaseModel):
 # APPROVAL WORKFLOW
 # ========================
 
-class Approval(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Approval(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=_new_id)
     run_id: str
     action_type: str  # send_email, add_source, schedule_monitoring, export_csv, send_alert
     title: str
@@ -84,7 +97,7 @@ class Approval(BaseModel):
     confidence: float  # 0-1
     parameters: Dict[str, Any]  # action-specific params
     status: str = "pending"  # pending, approved, rejected, executed
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = msgspec.field(default_factory=_utc_now)
     approved_at: Optional[datetime] = None
     executed_at: Optional[datetime] = None
     approved_by: Optional[str] = None
@@ -93,8 +106,8 @@ class Approval(BaseModel):
 # TREND FORECASTING
 # ========================
 
-class TrendForecast(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class TrendForecast(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=_new_id)
     run_id: str
     trend_category: str  # partnerships, funding, pricing, technology, destinations
     trend_name: str
@@ -105,14 +118,14 @@ class TrendForecast(BaseModel):
     key_indicators: List[str]
     potential_impact: str
     recommended_actions: List[str]
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = msgspec.field(default_factory=_utc_now)
 
 # ========================
 # AGENTIC INSIGHTS
 # ========================
 
-class AgenticInsight(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class AgenticInsight(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=_new_id)
     run_id: str
     impact_scenarios: List[ImpactScenario]
     dashboard_recommendations: List[DashboardWidget]
@@ -120,5 +133,47 @@ class AgenticInsight(BaseModel):
     key_findings: List[str]
     risk_alerts: List[str]
     opportunities: List[str]
-    generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    generated_at: datetime = msgspec.field(default_factory=_utc_now)
     processing_time_seconds: float = 0.0
+
+
+# ========================
+# LLM OUTPUT SCHEMAS
+# ========================
+# Shapes the model is asked to emit; server-side fields (id, run_id,
+# timestamps, assignment) are filled in when the records are built.
+
+class ActionItemDraft(msgspec.Struct, kw_only=True):
+    title: str
+    description: str
+    priority: str  # P0, P1, P2
+    assigned_role: str  # analyst, executive, marketing, risk
+    due_date: Optional[str] = None
+    reasoning: str
+    related_events: List[str] = []
+
+class ApprovalDraft(msgspec.Struct, kw_only=True):
+    action_type: str  # send_email, add_source, schedule_monitoring, export_csv, send_alert
+    title: str
+    description: str
+    reasoning: str
+    confidence: float  # 0-1
+    parameters: Dict[str, Any] = {}
+
+class TrendForecastDraft(msgspec.Struct, kw_only=True):
+    trend_category: str  # partnerships, funding, pricing, technology, destinations
+    trend_name: str
+    description: str
+    forecast_horizon: str  # next_quarter, next_6_months, next_year
+    confidence: float  # 0-1
+    supporting_events: List[str] = []
+    key_indicators: List[str] = []
+    potential_impact: str
+    recommended_actions: List[str] = []
+
+class AgenticBundle(msgspec.Struct, kw_only=True):
+    impact_scenarios: List[ImpactScenario] = []
+    dashboard_widgets: List[DashboardWidget] = []
+    action_items: List[ActionItemDraft] = []
+    approvals: List[ApprovalDraft] = []
+    trend_forecasts: List[TrendForecastDraft] = []
@@ -0,0 +1,64 @@
+"""
+LLM Response Cache for SafarAI
+In-process TTL cache that short-circuits repeated LLM prompts
+"""
+import asyncio
+import hashlib
+import logging
+from typing import Any, Optional, Callable, Awaitable, TypeVar
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LRUCache:
+    """Asyncio-safe LRU cache with per-entry time-to-live. Values may be any object."""
+
+    def __init__(self, maxsize: int = 1000, ttl: float = 24 * 60 * 60):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[Any]:
+        async with self._lock:
+            return self._cache.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        async with self._lock:
+            self._cache[key] = value
+
+    async def clear(self) -> None:
+        async with self._lock:
+            self._cache.clear()
+
+
+response_cache = LRUCache(maxsize=1000, ttl=24 * 60 * 60)
+
+
+def make_cache_key(system_prompt: str, user_text: str) -> str:
+    """Hash the full prompt (system + user text) into a cache key"""
+    return hashlib.sha256((system_prompt + user_text).encode()).hexdigest()
+
+
+async def _send_direct(chat, user_message) -> str:
+    return await chat.send_message(user_message)
+
+
+async def cached_send(chat, user_message, cache_key: str, parse: Callable[[str], T],
+                      send: Optional[Callable[..., Awaitable[str]]] = None) -> T:
+    """
+    Send a message through the cache, skipping the LLM on a hit, and return parse(response).
+    A response is only cached once parse accepts it, so a malformed reply is retried next time.
+    """
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"LLM response cache hit: {cache_key[:12]}")
+        return parse(cached)
+
+    response = await (send or _send_direct)(chat, user_message)
+    result = parse(response)
+    if response:
+        await response_cache.set(cache_key, response)
+    return result
@@ -1,50 +1,68 @@
 from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from dotenv import load_dotenv
+from jinja2 import Environment, FileSystemLoader
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne, ReturnDocument
 import os
 import logging
-import hashlib
 import asyncio
+import heapq
 import io
+import re
+import weakref
+from collections import deque
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import uuid
 from datetime import datetime, timezone
-import json
-import resend
-from firecrawl import FirecrawlApp
-from reducto import Reducto
+import httpx
+import xxhash
+from croniter import croniter
+from firecrawl import AsyncFirecrawl
+from firecrawl.types import ScrapeOptions
+from reducto import AsyncReducto
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 
 # Import agentic modules
 from agentic_models import (
     TeamMember, TeamMemberCreate, ActionItem, ActionItemUpdate,
     Approval, TrendForecast, AgenticInsight
 )
-from agentic_engine import generate_agentic_insights
+from agentic_engine import generate_agentic_insights, new_chat, extract_json_object, warm_token_encoder
+from response_cache import LRUCache
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
 db = client[os.environ['DB_NAME']]
 
 # Initialize APIs
-resend.api_key = os.environ.get('RESEND_API_KEY', '')
-firecrawl = FirecrawlApp(api_key=os.environ.get('FIRECRAWL_API_KEY', ''))
-reducto_client = Reducto(api_key=os.environ.get('REDUCTO_API_KEY', ''))
+RESEND_API_KEY = os.environ.get('RESEND_API_KEY', '')
+RESEND_EMAILS_URL = "https://api.resend.com/emails"
+firecrawl = AsyncFirecrawl(api_key=os.environ.get('FIRECRAWL_API_KEY', ''))
+reducto_client = AsyncReducto(api_key=os.environ.get('REDUCTO_API_KEY', ''))
+http_client = httpx.AsyncClient(timeout=10.0, follow_redirects=True)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="SafarAI Intelligence Platform")
+# orjson renders the large event/brief payloads several times faster than stdlib json
+app = FastAPI(title="SafarAI Intelligence Platform", default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
 # ========================
 # PYDANTIC MODELS
 # ========================
@@ -56,7 +74,7 @@ class Source(BaseModel):
     url: str
     category: str = "general"
     active: bool = True
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utc_now)
 
 class SourceCreate(BaseModel):
     name: str
@@ -79,8 +97,8 @@ class Item(BaseModel):
     content_text: str
     content_type: str = "html"
     content_hash: str
-    fetched_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    last_seen_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    fetched_at: datetime = Field(default_factory=_utc_now)
+    last_seen_at: datetime = Field(default_factory=_utc_now)
 
 class Event(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -99,14 +117,43 @@ class Event(BaseModel):
     source_url: str
     is_pdf_source: bool = False  # Flag for PDF-sourced content
     pdf_source_url: Optional[str] = None  # Original PDF URL if parsed from PDF
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utc_now)
+
+class KeyEntities(BaseModel):
+    partners: List[Any] = []
+    campaigns: List[Any] = []
+    packages: List[Any] = []
+    discounts: List[Any] = []
+    locations: List[Any] = []
+    amounts: List[Any] = []
+    dates: List[Any] = []
+
+class EventClassification(BaseModel):
+    """Structured output returned by the LLM for one document."""
+    model_config = ConfigDict(extra="ignore")
+    company: str
+    event_type: str
+    title: str
+    summary: str
+    why_it_matters: str
+    materiality_score: int = 0
+    confidence: float = 0.0
+    key_entities: KeyEntities = Field(default_factory=KeyEntities)
+    evidence_quotes: List[str] = []
+
+class ClassificationResponse(BaseModel):
+    # Required so an unparseable response is an error rather than a cached "not relevant"
+    event: Optional[EventClassification]  # null when the content is not relevant
+
+class BatchClassificationResponse(BaseModel):
+    events: List[Optional[EventClassification]]
 
 class Run(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime = Field(default_factory=_utc_now)
     finished_at: Optional[datetime] = None
-    status: str = "running"
+    status: str = "queued"  # queued -> running -> success | partial_failure | failure
     sources_total: int = 0
     sources_ok: int = 0
     sources_failed: int = 0
@@ -124,7 +171,7 @@ class RunLog(BaseModel):
     level: str = "info"
     message: str
     meta: Dict[str, Any] = {}
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utc_now)
 
 class ScheduledRun(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -134,7 +181,7 @@ class ScheduledRun(BaseModel):
     enabled: bool = True
     last_run_at: Optional[datetime] = None
     next_run_at: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utc_now)
 
 class ScheduledRunCreate(BaseModel):
     cron_expression: str
@@ -153,6 +200,40 @@ class SourceHealth(BaseModel):
     last_failure_at: Optional[str] = None
     last_error: Optional[str] = None
 
+# Response models for the large list endpoints: FastAPI serializes them through pydantic-core
+# instead of walking plain dicts with jsonable_encoder before ORJSONResponse renders them.
+
+class RunLogEntry(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    run_id: Optional[str] = None
+    level: str = "info"
+    message: str
+    meta: Dict[str, Any] = {}
+    created_at: str
+
+class RunLogsResponse(BaseModel):
+    run_id: Optional[str] = None
+    logs: List[RunLogEntry]
+    message: Optional[str] = None
+
+class SourcesResponse(BaseModel):
+    sources: List[Source]
+
+class SourceHealthResponse(BaseModel):
+    health: List[SourceHealth]
+
+class BriefSummary(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    run_id: Optional[str] = None
+    pdfs_processed: int = 0
+    created_at: str
+    event_count: int = 0
+
+class BriefsResponse(BaseModel):
+    briefs: List[BriefSummary]
+
 # ========================
 # DEFAULT SOURCES
 # ========================
@@ -184,23 +265,32 @@ BLOCKED_DOMAINS = [
 # ========================
 
 def compute_hash(content: str) -> str:
-    return hashlib.sha256(content[:12000].encode()).hexdigest()
+    return xxhash.xxh3_128_hexdigest(content[:12000].encode('utf-8', 'ignore'))
+
+# Case-insensitive matchers compiled once, so link checks don't lowercase every URL
+_BLOCKED_DOMAINS_RE = re.compile("|".join(map(re.escape, BLOCKED_DOMAINS)), re.IGNORECASE)
+_KEYWORDS_RE = re.compile("|".join(map(re.escape, KEYWORDS)), re.IGNORECASE)
+_PDF_LINK_RE = re.compile(r"\.pdf$|/pdf/|pdf=", re.IGNORECASE)
+_PDF_CONTENT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'https?://[^\s\)\]"\']+\.pdf(?:\?[^\s\)\]"\']*)?',
+        r'href=["\']([^"\']+\.pdf[^"\']*)["\']',
+        r'\[([^\]]+)\]\(([^)]+\.pdf[^)]*)\)'
+    )
+]
 
 def filter_link(url: str) -> bool:
-    url_lower = url.lower()
     # Block social media domains
-    if any(domain in url_lower for domain in BLOCKED_DOMAINS):
+    if _BLOCKED_DOMAINS_RE.search(url):
         return False
-    return any(kw in url_lower for kw in KEYWORDS)
+    return _KEYWORDS_RE.search(url) is not None
 
 def is_pdf_link(url: str) -> bool:
     """Check if URL points to a PDF file."""
-    url_lower = url.lower()
-    return url_lower.endswith('.pdf') or '/pdf/' in url_lower or 'pdf=' in url_lower
+    return _PDF_LINK_RE.search(url) is not None
 
 def extract_pdf_links(markdown_content: str, links: List[str], base_url: str) -> List[str]:
     """Extract PDF links from page content and links list."""
-    import re
     pdf_links = []
     
     # Check existing links for PDFs
@@ -210,14 +300,8 @@ def extract_pdf_links(markdown_content: str, links: List[str], base_url: str) ->
                 pdf_links.append(link)
     
     # Also search markdown content for PDF URLs
-    pdf_patterns = [
-        r'https?://[^\s\)\]"\']+\.pdf(?:\?[^\s\)\]"\']*)?',
-        r'href=["\']([^"\']+\.pdf[^"\']*)["\']',
-        r'\[([^\]]+)\]\(([^)]+\.pdf[^)]*)\)'
-    ]
-    
-    for pattern in pdf_patterns:
-        matches = re.findall(pattern, markdown_content, re.IGNORECASE)
+    for pattern in _PDF_CONTENT_PATTERNS:
+        matches = pattern.findall(markdown_content)
         for match in matches:
             url = match if isinstance(match, str) else (match[1] if len(match) > 1 else match[0])
             if url and url.startswith('http') and url not in pdf_links:
@@ -225,11 +309,30 @@ def extract_pdf_links(markdown_content: str, links: List[str], base_url: str) ->
     
     return pdf_links[:10]  # Limit to 10 PDF links per source
 
+# Run log documents waiting to be written; flushed in batches by run_log_flusher
+RUN_LOG_FLUSH_INTERVAL_SECONDS = 0.5
+_run_log_buffer: deque = deque()
+
+async def flush_run_logs():
+    """Write all buffered run logs in one insert_many."""
+    docs = []
+    while _run_log_buffer:
+        docs.append(_run_log_buffer.popleft())
+    if docs:
+        await db.run_logs.insert_many(docs, ordered=False)
+
+async def run_log_flusher():
+    """Background task that flushes buffered run logs on a short interval."""
+    while True:
+        await asyncio.sleep(RUN_LOG_FLUSH_INTERVAL_SECONDS)
+        try:
+            await flush_run_logs()
+        except Exception as e:
+            logger.error(f"Failed to flush run logs: {e}")
+
 async def log_run(run_id: str, level: str, message: str, meta: dict = None):
     log = RunLog(run_id=run_id, level=level, message=message, meta=meta or {})
-    doc = log.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
-    await db.run_logs.insert_one(doc)
+    _run_log_buffer.append(log.model_dump(mode='json'))
     if level == "error":
         logger.error(f"[{run_id}] {message}")
     else:
@@ -243,10 +346,7 @@ async def process_pdf_with_reducto(pdf_url: str, run_id: str) -> Optional[Dict]:
     try:
         await log_run(run_id, "info", f"Processing PDF with Reducto: {pdf_url}")
         
-        pdf_result = await asyncio.to_thread(
-            reducto_client.parse.run,
-            input=pdf_url
-        )
+        pdf_result = await reducto_client.parse.run(input=pdf_url)
         
         # Extract text from chunks
         markdown_parts = []
@@ -287,17 +387,45 @@ async def process_pdf_with_reducto(pdf_url: str, run_id: str) -> Optional[Dict]:
 # LLM CLASSIFICATION
 # ========================
 
-async def classify_content(content: str, url: str, title: str) -> Optional[Dict]:
-    """Use Emergent LLM to classify content into structured intelligence."""
-    try:
-        from emergentintegrations.llm.chat import LlmChat, UserMessage
-        
-        system_prompt = """You are a competitive intelligence analyst for the tourism and hospitality industry.
-Analyze the provided content and extract structured intelligence.
-You MUST return ONLY valid JSON with NO markdown formatting, NO code blocks, NO explanation.
+# Classifications are reused for identical content for this long
+CLASSIFICATION_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
 
-Return this exact JSON structure:
-{
+async def get_cached_classification(content_hash: str) -> Optional[Dict]:
+    """Look up a previous classification for identical content."""
+    return await db.classification_cache.find_one(
+        {"content_hash": content_hash},
+        {"_id": 0, "result": 1}
+    )
+
+async def get_cached_classifications(content_hashes: List[str]) -> Dict[str, Dict]:
+    """Look up previous classifications for several documents in one query, keyed by content hash."""
+    unique_hashes = list(set(content_hashes))
+    cached = await db.classification_cache.find(
+        {"content_hash": {"$in": unique_hashes}},
+        {"_id": 0, "content_hash": 1, "result": 1}
+    ).to_list(len(unique_hashes))
+    return {doc["content_hash"]: doc for doc in cached}
+
+async def store_classification(content_hash: str, result: Optional[Dict]):
+    """Remember a classification (including a null verdict) for this content."""
+    await db.classification_cache.update_one(
+        {"content_hash": content_hash},
+        # created_at is a BSON date here so the TTL index can expire it
+        {"$set": {"result": result, "created_at": _utc_now()}},
+        upsert=True
+    )
+
+def _json_schema_format(name: str, model: type) -> Dict:
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": model.model_json_schema(), "strict": False}
+    }
+
+# Structured Outputs formats so the provider returns bare JSON
+CLASSIFY_RESPONSE_FORMAT = _json_schema_format("event_classification", ClassificationResponse)
+CLASSIFY_BATCH_RESPONSE_FORMAT = _json_schema_format("event_classification_batch", BatchClassificationResponse)
+
+CLASSIFICATION_SCHEMA = """{
   "company": "string - company name mentioned",
   "event_type": "one of: partnership | funding | campaign_deal | pricing_change | acquisition | hiring_exec | other",
   "title": "string - brief title of the event",
@@ -314,17 +442,72 @@ Return this exact JSON structure:
     "amounts": [],
     "dates": []
   },
-  "evidence_quotes": ["2-3 short snippets from the content"],
-  "source_url": "the source url"
-}
+  "evidence_quotes": ["2-3 short snippets from the content"]
+}"""
+
+CLASSIFY_SYSTEM_PROMPT = f"""You are a competitive intelligence analyst for the tourism and hospitality industry.
+Analyze the provided content and extract structured intelligence.
+You MUST return ONLY valid JSON with NO markdown formatting, NO code blocks, NO explanation.
 
-If content is not relevant to tourism/hospitality intelligence, return null."""
+Return {{"event": <event>}} where <event> is this exact JSON structure:
+{CLASSIFICATION_SCHEMA}
 
-        chat = LlmChat(
-            api_key=os.environ.get('EMERGENT_LLM_KEY', ''),
-            session_id=f"classify-{uuid.uuid4()}",
-            system_message=system_prompt
-        ).with_model("openai", "gpt-5.2")
+If content is not relevant to tourism/hospitality intelligence, return {{"event": null}}."""
+
+CLASSIFY_BATCH_SYSTEM_PROMPT = f"""You are a competitive intelligence analyst for the tourism and hospitality industry.
+You will receive several numbered documents. Analyze each one and extract structured intelligence.
+You MUST return ONLY valid JSON with NO markdown formatting, NO code blocks, NO explanation.
+Return {{"events": [...]}} where the array contains exactly one entry per document, in the same order as the documents.
+
+Each entry is either null (if the document is not relevant to tourism/hospitality intelligence)
+or this exact JSON structure:
+{CLASSIFICATION_SCHEMA}"""
+
+# Documents per batched classification request
+CLASSIFY_BATCH_SIZE = 8
+
+# Cheap relevance prefilter: pages with fewer than MIN_TOURISM_TERMS hits never reach the LLM
+TOURISM_TERMS = frozenset({
+    "hotel", "hotels", "resort", "resorts", "tourism", "tourist", "tourists", "travel",
+    "traveler", "travelers", "traveller", "travellers", "hospitality", "airline", "airlines",
+    "flight", "flights", "airport", "booking", "bookings", "cruise", "cruises", "destination",
+    "destinations", "vacation", "vacations", "holiday", "holidays", "tour", "tours", "trip",
+    "trips", "stay", "stays", "guest", "guests", "room", "rooms", "lodging", "accommodation",
+    "accommodations", "airbnb", "marriott", "hilton", "hyatt", "expedia", "getaway", "package",
+    "packages", "itinerary", "loyalty", "rental", "rentals"
+})
+MIN_TOURISM_TERMS = 3
+_WORD_RE = re.compile(r"[a-z]+")
+
+def is_probably_relevant(text: str) -> bool:
+    """True if the text mentions enough tourism/hospitality terms to be worth classifying."""
+    hits = 0
+    for token in _WORD_RE.findall(text[:20000].lower()):
+        if token in TOURISM_TERMS:
+            hits += 1
+            if hits >= MIN_TOURISM_TERMS:
+                return True
+    return False
+
+async def classify_content(content: str, url: str, title: str, content_hash: Optional[str] = None) -> Optional[Dict]:
+    """Use Emergent LLM to classify content into structured intelligence."""
+    try:
+        content_hash = content_hash or compute_hash(content)
+        cached = await get_cached_classification(content_hash)
+        if cached is not None:
+            logger.info(f"Classification cache hit: {url}")
+            result = cached.get("result")
+            if result is None:
+                return None
+            return {**result, "source_url": url}
+        
+        if not is_probably_relevant(content):
+            logger.info(f"Skipping classification, no tourism signal: {url}")
+            return None
+        
+        from emergentintegrations.llm.chat import UserMessage
+        
+        chat = new_chat("classify", CLASSIFY_SYSTEM_PROMPT, response_format=CLASSIFY_RESPONSE_FORMAT)
         
         user_message = UserMessage(
             text=f"URL: {url}\nTitle: {title}\n\nContent:\n{content[:8000]}"
@@ -332,234 +515,172 @@ If content is not relevant to tourism/hospitality intelligence, return null."""
         
         response = await chat.send_message(user_message)
         
-        # Parse JSON response
-        response_text = response.strip()
-        if response_text.lower() == "null" or not response_text:
+        # Structured output is not applied by every LlmChat version, so tolerate fences and prose
+        parsed = ClassificationResponse.model_validate_json(extract_json_object(response))
+        if parsed.event is None:
+            await store_classification(content_hash, None)
             return None
         
-        # Clean up response if it has markdown code blocks
-        if "```json" in response_text:
-            start = response_text.find("```json") + 7
-            end = response_text.find("```", start)
-            response_text = response_text[start:end].strip() if end > start else response_text
-        elif response_text.startswith("```"):
-            lines = response_text.split("\n")
-            response_text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
-        
-        # Find JSON object in response
-        json_start = response_text.find("{")
-        json_end = response_text.rfind("}") + 1
-        if json_start >= 0 and json_end > json_start:
-            response_text = response_text[json_start:json_end]
-        
-        result = json.loads(response_text)
+        result = parsed.event.model_dump()
         result["source_url"] = url
+        await store_classification(content_hash, result)
         return result
         
     except Exception as e:
         logger.error(f"LLM classification error: {e}")
         return None
 
+async def _classify_batch_llm(items: List[Tuple[str, str, str]]) -> Optional[List[Optional[Dict]]]:
+    """Classify several documents in one LLM request. Returns None if the response is unusable."""
+    try:
+        from emergentintegrations.llm.chat import UserMessage
+        
+        chat = new_chat("classify-batch", CLASSIFY_BATCH_SYSTEM_PROMPT, response_format=CLASSIFY_BATCH_RESPONSE_FORMAT)
+        
+        blocks = [
+            f"### Document {n}\nURL: {url}\nTitle: {title}\n\nContent:\n{content[:8000]}"
+            for n, (content, url, title) in enumerate(items, start=1)
+        ]
+        user_message = UserMessage(
+            text=f"Analyze each of the following {len(items)} documents. "
+                 f"Return one entry per input (or null) in the events array.\n\n" + "\n\n".join(blocks)
+        )
+        
+        response = await chat.send_message(user_message)
+        
+        results = BatchClassificationResponse.model_validate_json(extract_json_object(response)).events
+        if len(results) != len(items):
+            logger.warning(f"Batch classification returned {len(results)} results for {len(items)} documents")
+            return None
+        
+        return [r.model_dump() if r is not None else None for r in results]
+        
+    except Exception as e:
+        logger.error(f"LLM batch classification error: {e}")
+        return None
+
+async def classify_content_batch(items: List[Tuple[str, str, str]], hashes: Optional[List[str]] = None) -> List[Optional[Dict]]:
+    """
+    Classify (content, url, title) items, reusing cached results and sending
+    the remaining documents to the LLM CLASSIFY_BATCH_SIZE at a time.
+    Results are returned in input order. Pass hashes when the caller already computed them.
+    """
+    results: List[Optional[Dict]] = [None] * len(items)
+    if hashes is None:
+        hashes = [compute_hash(content) for content, _, _ in items]
+    
+    cached_by_hash = await get_cached_classifications(hashes) if items else {}
+    misses = []
+    for i, (content, url, _) in enumerate(items):
+        cached = cached_by_hash.get(hashes[i])
+        if cached is None:
+            # Off-topic pages stay None without spending an LLM call
+            if is_probably_relevant(content):
+                misses.append(i)
+            else:
+                logger.info(f"Skipping classification, no tourism signal: {url}")
+        elif cached.get("result") is not None:
+            results[i] = {**cached["result"], "source_url": url}
+    
+    for start in range(0, len(misses), CLASSIFY_BATCH_SIZE):
+        chunk = misses[start:start + CLASSIFY_BATCH_SIZE]
+        batch = await _classify_batch_llm([items[i] for i in chunk]) if len(chunk) > 1 else None
+        
+        if batch is None:
+            # Single document or unusable batch response: classify individually
+            for i in chunk:
+                content, url, title = items[i]
+                results[i] = await classify_content(content, url, title, content_hash=hashes[i])
+            continue
+        
+        for i, result in zip(chunk, batch):
+            if result is not None:
+                result["source_url"] = items[i][1]
+            await store_classification(hashes[i], result)
+            results[i] = result
+    
+    return results
+
+async def create_events_from_items(run_id: str, pending: List[Dict]) -> List[Dict]:
+    """
+    Classify stored items in batches and insert an event for each relevant one.
+    Each pending entry has content (the stored, already-truncated text), content_hash,
+    url, title, item_id and optional extra event fields.
+    Returns the inserted event documents.
+    """
+    if not pending:
+        return []
+    
+    classifications = await classify_content_batch(
+        [(p['content'], p['url'], p['title']) for p in pending],
+        hashes=[p['content_hash'] for p in pending]
+    )
+    
+    now = _utc_now()
+    event_docs = []
+    for p, classification in zip(pending, classifications):
+        if not classification:
+            continue
+        classification.update(p.get('extra', {}))
+        event = Event(run_id=run_id, item_id=p['item_id'], created_at=now, **classification)
+        event_doc = event.model_dump(mode='json')
+        event_docs.append(event_doc)
+    
+    if event_docs:
+        await db.events.insert_many(event_docs, ordered=False)
+    
+    return event_docs
+
 # ========================
 # EMAIL BRIEF GENERATION
 # ========================
 
+# Compiled once at import; autoescape keeps LLM-extracted text from injecting markup
+brief_env = Environment(
+    loader=FileSystemLoader(ROOT_DIR / 'templates'),
+    autoescape=True,
+    auto_reload=False
+)
+BRIEF_TEMPLATE = brief_env.get_template('brief.html.j2')
+
 def generate_html_brief(events: List[Dict], run: Dict) -> str:
     """Generate stunning black & white HTML executive briefing email."""
     
-    top_movers = [e for e in events if e.get('materiality_score', 0) >= 70]
-    partnerships = [e for e in events if e.get('event_type') == 'partnership']
-    funding = [e for e in events if e.get('event_type') == 'funding']
-    campaigns = [e for e in events if e.get('event_type') == 'campaign_deal']
-    
-    def event_card(event: Dict) -> str:
-        event_type = event.get('event_type', 'other').replace('_', ' ').upper()
-        is_pdf = event.get('is_pdf_source', False)
-        pdf_url = event.get('pdf_source_url', '')
-        
-        # PDF source indicator
-        pdf_badge = ""
-        if is_pdf:
-            pdf_badge = '''
-            <span style="background:#dc2626;color:#fff;padding:4px 10px;border-radius:100px;font-size:9px;font-weight:700;text-transform:uppercase;letter-spacing:1px;margin-left:8px;">
-                PDF SOURCE
-            </span>
-            '''
-        
-        quotes_html = ""
-        for quote in event.get('evidence_quotes', [])[:2]:
-            quotes_html += f'''
-            <div style="border-left:2px solid #333;padding-left:16px;margin:16px 0;">
-                <p style="font-style:italic;color:#888;font-size:13px;margin:0;line-height:1.6;">"{quote[:150]}..."</p>
-            </div>
-            '''
-        
-        # PDF source link section
-        pdf_source_html = ""
-        if is_pdf and pdf_url:
-            pdf_source_html = f'''
-            <div style="margin-top:12px;padding:12px 16px;background:#1a0a0a;border-radius:8px;border:1px solid #dc262620;">
-                <p style="color:#dc2626;font-size:10px;margin:0 0 4px 0;text-transform:uppercase;letter-spacing:1px;font-weight:600;">
-                    Parsed from PDF Document
-                </p>
-                <a href="{pdf_url}" style="color:#f87171;font-size:11px;text-decoration:none;word-break:break-all;">
-                    {pdf_url[:80]}{'...' if len(pdf_url) > 80 else ''}
-                </a>
-            </div>
-            '''
-        
-        return f'''
-        <div style="background:#0a0a0a;border-radius:12px;padding:28px;margin-bottom:16px;border:1px solid #1a1a1a;border-left:3px solid {'#dc2626' if is_pdf else '#fff'};">
-            <div style="margin-bottom:20px;">
-                <span style="background:#fff;color:#000;padding:6px 16px;border-radius:100px;font-size:10px;font-weight:700;text-transform:uppercase;letter-spacing:1px;">
-                    {event_type}
-                </span>
-                {pdf_badge}
-            </div>
-            <h3 style="color:#fff;margin:0 0 12px 0;font-size:22px;font-weight:600;line-height:1.3;">{event.get('title', 'N/A')}</h3>
-            <p style="color:#666;font-size:14px;margin:0 0 16px 0;text-transform:uppercase;letter-spacing:0.5px;">{event.get('company', 'Unknown Company')}</p>
-            <p style="color:#aaa;font-size:15px;margin:0 0 20px 0;line-height:1.7;">{event.get('summary', '')}</p>
-            
-            <div style="background:#111;border-radius:8px;padding:20px;margin:20px 0;border:1px solid #222;">
-                <p style="color:#fff;font-size:11px;margin:0 0 8px 0;text-transform:uppercase;letter-spacing:1px;opacity:0.5;">Why It Matters</p>
-                <p style="color:#ccc;font-size:14px;margin:0;line-height:1.6;">{event.get('why_it_matters', '')}</p>
-            </div>
-            
-            {quotes_html}
-            {pdf_source_html}
-            
-            <div style="margin-top:20px;padding-top:20px;border-top:1px solid #222;">
-                <a href="{event.get('source_url', '#')}" style="color:#fff;font-size:12px;text-decoration:none;text-transform:uppercase;letter-spacing:1px;opacity:0.6;">
-                    View Source →
-                </a>
-            </div>
-        </div>
-        '''
-    
-    def section(title: str, items: List[Dict]) -> str:
-        if not items:
-            return ""
-        cards = "".join(event_card(e) for e in items[:5])
-        return f'''
-        <div style="margin-bottom:48px;">
-            <div style="margin-bottom:24px;padding-bottom:16px;border-bottom:1px solid #222;">
-                <h2 style="color:#fff;font-size:14px;margin:0;font-weight:600;text-transform:uppercase;letter-spacing:2px;">{title}</h2>
-                <p style="color:#555;font-size:12px;margin:8px 0 0 0;">{len(items)} item{'s' if len(items) != 1 else ''}</p>
-            </div>
-            {cards}
-        </div>
-        '''
-    
-    today = datetime.now(timezone.utc).strftime("%B %d, %Y")
-    time_now = datetime.now(timezone.utc).strftime("%H:%M UTC")
-    total_events = len(events)
-    high_priority = len([e for e in events if e.get('materiality_score', 0) >= 70])
-    pdf_sourced = len([e for e in events if e.get('is_pdf_source', False)])
-    
-    # Create PDF section if we have PDF-sourced events
-    pdf_events = [e for e in events if e.get('is_pdf_source', False)]
-    
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;600;700&display=swap" rel="stylesheet">
-    </head>
-    <body style="font-family:'Space Grotesk',-apple-system,sans-serif;background:#000;margin:0;padding:0;color:#fff;">
-        <div style="max-width:680px;margin:0 auto;">
-            
-            <!-- Header -->
-            <div style="padding:60px 40px;text-align:center;border-bottom:1px solid #1a1a1a;">
-                <div style="width:64px;height:64px;border-radius:16px;background:#fff;margin:0 auto 24px;display:flex;align-items:center;justify-content:center;">
-                    <svg width="32" height="32" viewBox="0 0 24 24" fill="none" stroke="#000" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                        <circle cx="12" cy="12" r="10"></circle>
-                        <line x1="2" y1="12" x2="22" y2="12"></line>
-                        <path d="M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"></path>
-                    </svg>
-                </div>
-                <h1 style="color:#fff;font-size:32px;margin:0 0 8px 0;font-weight:700;letter-spacing:-1px;">
-                    SAFAR<span style="opacity:0.4;">AI</span>
-                </h1>
-                <p style="color:#555;font-size:11px;margin:0 0 32px 0;text-transform:uppercase;letter-spacing:4px;">
-                    Intelligence Brief
-                </p>
-                <div style="display:inline-block;background:#0a0a0a;padding:12px 28px;border-radius:100px;border:1px solid #1a1a1a;">
-                    <p style="color:#888;font-size:13px;margin:0;">{today} · {time_now}</p>
-                </div>
-            </div>
-            
-            <!-- Stats Bar -->
-            <div style="display:flex;border-bottom:1px solid #1a1a1a;">
-                <div style="flex:1;padding:32px;text-align:center;border-right:1px solid #1a1a1a;">
-                    <p style="color:#fff;font-size:36px;font-weight:700;margin:0;font-family:monospace;">{total_events}</p>
-                    <p style="color:#555;font-size:10px;margin:8px 0 0 0;text-transform:uppercase;letter-spacing:1px;">Events</p>
-                </div>
-                <div style="flex:1;padding:32px;text-align:center;border-right:1px solid #1a1a1a;">
-                    <p style="color:#fff;font-size:36px;font-weight:700;margin:0;font-family:monospace;">{high_priority}</p>
-                    <p style="color:#555;font-size:10px;margin:8px 0 0 0;text-transform:uppercase;letter-spacing:1px;">High Priority</p>
-                </div>
-                <div style="flex:1;padding:32px;text-align:center;border-right:1px solid #1a1a1a;">
-                    <p style="color:#dc2626;font-size:36px;font-weight:700;margin:0;font-family:monospace;">{pdf_sourced}</p>
-                    <p style="color:#555;font-size:10px;margin:8px 0 0 0;text-transform:uppercase;letter-spacing:1px;">From PDFs</p>
-                </div>
-                <div style="flex:1;padding:32px;text-align:center;">
-                    <p style="color:#fff;font-size:36px;font-weight:700;margin:0;font-family:monospace;">{run.get('sources_ok', 0)}/{run.get('sources_total', 0)}</p>
-                    <p style="color:#555;font-size:10px;margin:8px 0 0 0;text-transform:uppercase;letter-spacing:1px;">Sources</p>
-                </div>
-            </div>
-            
-            <!-- Main Content -->
-            <div style="padding:48px 40px;">
-                {section("PDF Intelligence", pdf_events) if pdf_events else ""}
-                {section("Top Movers", top_movers)}
-                {section("Partnerships", partnerships)}
-                {section("Funding", funding)}
-                {section("Campaigns & Deals", campaigns)}
-            </div>
-            
-            <!-- Pipeline Health -->
-            <div style="padding:40px;background:#0a0a0a;border-top:1px solid #1a1a1a;">
-                <p style="color:#555;font-size:10px;margin:0 0 20px 0;text-transform:uppercase;letter-spacing:2px;">Pipeline Health</p>
-                <div style="display:flex;gap:16px;">
-                    <div style="flex:1;background:#111;padding:20px;border-radius:8px;border:1px solid #1a1a1a;">
-                        <p style="color:#555;font-size:10px;margin:0 0 8px 0;text-transform:uppercase;">Status</p>
-                        <p style="color:{'#fff' if run.get('status') == 'success' else '#888'};font-size:14px;margin:0;font-weight:600;">
-                            {run.get('status', 'unknown').upper()}
-                        </p>
-                    </div>
-                    <div style="flex:1;background:#111;padding:20px;border-radius:8px;border:1px solid #1a1a1a;">
-                        <p style="color:#555;font-size:10px;margin:0 0 8px 0;text-transform:uppercase;">New</p>
-                        <p style="color:#fff;font-size:14px;margin:0;font-weight:600;">{run.get('items_new', 0)}</p>
-                    </div>
-                    <div style="flex:1;background:#111;padding:20px;border-radius:8px;border:1px solid #1a1a1a;">
-                        <p style="color:#555;font-size:10px;margin:0 0 8px 0;text-transform:uppercase;">Updated</p>
-                        <p style="color:#fff;font-size:14px;margin:0;font-weight:600;">{run.get('items_updated', 0)}</p>
-                    </div>
-                    <div style="flex:1;background:#111;padding:20px;border-radius:8px;border:1px solid #1a1a1a;">
-                        <p style="color:#555;font-size:10px;margin:0 0 8px 0;text-transform:uppercase;">Events</p>
-                        <p style="color:#fff;font-size:14px;margin:0;font-weight:600;">{run.get('events_created', 0)}</p>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Footer -->
-            <div style="padding:40px;text-align:center;border-top:1px solid #1a1a1a;">
-                <p style="color:#444;font-size:12px;margin:0;">
-                    Powered by <strong style="color:#888;">SafarAI</strong>
-                </p>
-                <p style="color:#333;font-size:10px;margin:8px 0 0 0;text-transform:uppercase;letter-spacing:1px;">
-                    Tourism & Hospitality Intelligence
-                </p>
-            </div>
-            
-        </div>
-    </body>
-    </html>
-    '''
+    # Partition events into brief sections in a single pass
+    buckets = {"partnership": [], "funding": [], "campaign_deal": []}
+    top_movers = []
+    pdf_events = []  # Create PDF section if we have PDF-sourced events
+    for e in events:
+        if e.get('materiality_score', 0) >= 70:
+            top_movers.append(e)
+        bucket = buckets.get(e.get('event_type'))
+        if bucket is not None:
+            bucket.append(e)
+        if e.get('is_pdf_source', False):
+            pdf_events.append(e)
     
-    return html
+    now = _utc_now()
+    return BRIEF_TEMPLATE.render(
+        run=run,
+        total_events=len(events),
+        top_movers=top_movers,
+        partnerships=buckets["partnership"],
+        funding=buckets["funding"],
+        campaigns=buckets["campaign_deal"],
+        pdf_events=pdf_events,
+        today=now.strftime("%B %d, %Y"),
+        time_now=now.strftime("%H:%M UTC")
+    )
+
+async def post_resend_email(params: Dict) -> Dict:
+    """Send an email through the Resend HTTP API on the shared async client."""
+    response = await http_client.post(
+        RESEND_EMAILS_URL,
+        headers={"Authorization": f"Bearer {RESEND_API_KEY}"},
+        json=params
+    )
+    response.raise_for_status()
+    return response.json()
 
 async def send_brief_email(html_content: str, run: Dict) -> bool:
     """Send executive briefing via Resend."""
@@ -571,7 +692,7 @@ async def send_brief_email(html_content: str, run: Dict) -> bool:
             logger.warning("No recipients configured for email")
             return False
         
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        today = _utc_now().strftime("%Y-%m-%d")
         
         params = {
             "from": os.environ.get('SAFARAI_FROM_EMAIL', 'onboarding@resend.dev'),
@@ -580,7 +701,7 @@ async def send_brief_email(html_content: str, run: Dict) -> bool:
             "html": html_content
         }
         
-        email = await asyncio.to_thread(resend.Emails.send, params)
+        email = await post_resend_email(params)
         logger.info(f"Email sent successfully: {email}")
         return True
         
@@ -592,6 +713,357 @@ async def send_brief_email(html_content: str, run: Dict) -> bool:
 # PIPELINE EXECUTION
 # ========================
 
+# Sources crawled at the same time during a run
+SOURCE_CONCURRENCY = 8
+SOURCE_SEMAPHORE = asyncio.Semaphore(SOURCE_CONCURRENCY)
+
+# Child-link scrapes in flight across all sources, to stay inside Firecrawl rate limits
+CHILD_SCRAPE_SEMAPHORE = asyncio.Semaphore(3)
+
+# Upper bound on waiting for the run's Firecrawl batch scrape job
+FIRECRAWL_BATCH_TIMEOUT_SECONDS = 180
+
+# Scrape only the main content, accept Firecrawl's cached copy if under an hour old
+FIRECRAWL_MAX_AGE_MS = 60 * 60 * 1000
+FIRECRAWL_TIMEOUT_MS = 15000
+SOURCE_SCRAPE_OPTIONS = {
+    "formats": ['markdown', 'links'],
+    "only_main_content": True,
+    "max_age": FIRECRAWL_MAX_AGE_MS,
+    "timeout": FIRECRAWL_TIMEOUT_MS
+}
+CHILD_SCRAPE_OPTIONS = {**SOURCE_SCRAPE_OPTIONS, "formats": ['markdown']}
+
+SOURCE_COUNTERS = (
+    "sources_ok", "sources_failed", "items_total", "items_new",
+    "items_updated", "items_unchanged", "events_created", "pdfs_processed"
+)
+
+async def batch_scrape_sources(urls: List[str], run_id: str) -> Dict[str, Any]:
+    """
+    Scrape all HTML source pages in one Firecrawl batch job.
+    Returns documents keyed by source URL; URLs missing from the result are scraped individually.
+    """
+    if not urls:
+        return {}
+    
+    try:
+        job = await firecrawl.batch_scrape(
+            urls,
+            options=ScrapeOptions(**SOURCE_SCRAPE_OPTIONS),
+            poll_interval=2,
+            timeout=FIRECRAWL_BATCH_TIMEOUT_SECONDS
+        )
+        
+        documents = {}
+        for doc in job.data or []:
+            metadata = doc.metadata
+            doc_url = (getattr(metadata, 'source_url', None) or getattr(metadata, 'url', None)) if metadata else None
+            if doc_url:
+                documents[doc_url] = doc
+        
+        await log_run(run_id, "info", f"Batch scraped {len(documents)}/{len(urls)} source pages", {"status": job.status})
+        return documents
+    except Exception as e:
+        await log_run(run_id, "warn", "Firecrawl batch scrape failed, scraping sources individually", {"error": str(e)})
+        return {}
+
+async def check_source_unchanged(source: Dict) -> Tuple[bool, Dict[str, Optional[str]]]:
+    """
+    Conditional HEAD request against the validators stored from the last scrape.
+    Returns (unchanged, current validators); any failure counts as changed.
+    """
+    stored_etag = source.get('http_etag')
+    stored_last_modified = source.get('http_last_modified')
+    headers = {}
+    if stored_etag:
+        headers['If-None-Match'] = stored_etag
+    if stored_last_modified:
+        headers['If-Modified-Since'] = stored_last_modified
+    
+    try:
+        response = await http_client.head(source['url'], headers=headers)
+    except Exception:
+        return False, {}
+    
+    if response.status_code == 304:
+        return True, {"http_etag": stored_etag, "http_last_modified": stored_last_modified}
+    if response.status_code >= 400:
+        return False, {}
+    
+    etag = response.headers.get('etag')
+    last_modified = response.headers.get('last-modified')
+    if stored_etag:
+        unchanged = etag == stored_etag
+    else:
+        unchanged = bool(stored_last_modified) and last_modified == stored_last_modified
+    return unchanged, {"http_etag": etag, "http_last_modified": last_modified}
+
+async def process_source(source: Dict, run_id: str, prefetched: Optional[Any] = None,
+                         not_modified: bool = False, validators: Optional[Dict] = None) -> Dict:
+    """
+    Crawl a single source, store its items and classify them.
+    Returns per-source counters, created events, discovered PDF links and the
+    source health record, which run_pipeline merges once all sources have finished.
+    """
+    counts = {key: 0 for key in SOURCE_COUNTERS}
+    result = {"counts": counts, "events": [], "pdf_links": []}
+    
+    source_id = source['id']
+    source_url = source['url']
+    source_name = source['name']
+    
+    await log_run(run_id, "info", f"Processing source: {source_name}", {"url": source_url})
+    
+    start_time = _utc_now()
+    # One timestamp for every item written while processing this source
+    now = start_time
+    source_success = False
+    source_error = None
+    is_source_pdf = is_pdf_link(source_url)
+    scraped_fresh = False  # Whether the page came from the live site rather than Firecrawl's cache
+    pending_classification = []  # Items stored this source, classified together at the end
+    item_ops = []  # Item writes for this source, flushed in one bulk_write
+    
+    try:
+        if not_modified:
+            # Server reports the page unchanged since the last scrape - nothing to crawl or classify
+            await log_run(run_id, "info", f"Source unchanged since last run: {source_name}")
+            counts['items_unchanged'] += 1
+            counts['items_total'] += 1
+            item_ops.append(UpdateOne(
+                {"url": source_url},
+                {"$set": {"last_seen_at": now.isoformat()}}
+            ))
+        elif is_source_pdf:
+            # Source URL is itself a PDF - use Reducto
+            pdf_result = await process_pdf_with_reducto(source_url, run_id)
+            if pdf_result:
+                markdown = pdf_result['markdown']
+                title = source_name
+                links = []
+                
+                # Store item
+                content_hash = compute_hash(markdown)
+                item = Item(
+                    source_id=source_id,
+                    url=source_url,
+                    title=title,
+                    content_text=markdown[:50000],
+                    content_type="pdf",
+                    content_hash=content_hash,
+                    fetched_at=now,
+                    last_seen_at=now
+                )
+                item_doc = item.model_dump(mode='json')
+                item_doc['is_pdf'] = True
+                
+                item_ops.append(UpdateOne({"url": source_url}, {"$set": item_doc}, upsert=True))
+                counts['items_new'] += 1
+                counts['pdfs_processed'] += 1
+                
+                pending_classification.append({
+                    "content": item.content_text,
+                    "content_hash": content_hash,
+                    "url": source_url,
+                    "title": title,
+                    "item_id": item.id,
+                    "extra": {"is_pdf_source": True, "pdf_source_url": source_url}
+                })
+            else:
+                raise Exception("Failed to parse PDF source")
+        else:
+            # Crawl HTML page with Firecrawl unless the run's batch job already fetched it
+            crawl_result = prefetched or await firecrawl.scrape(source_url, **SOURCE_SCRAPE_OPTIONS)
+            
+            if not crawl_result:
+                raise Exception("Empty crawl result")
+            
+            # Handle Firecrawl Document object
+            if hasattr(crawl_result, 'markdown'):
+                markdown = crawl_result.markdown or ''
+                title = getattr(crawl_result.metadata, 'title', source_name) if hasattr(crawl_result, 'metadata') and crawl_result.metadata else source_name
+                links = getattr(crawl_result, 'links', []) or []
+                cache_state = getattr(getattr(crawl_result, 'metadata', None), 'cache_state', None)
+            else:
+                markdown = crawl_result.get('markdown', '')
+                title = crawl_result.get('metadata', {}).get('title', source_name)
+                links = crawl_result.get('links', [])
+                cache_state = crawl_result.get('metadata', {}).get('cache_state')
+            scraped_fresh = cache_state != 'hit'
+            
+            # Extract PDF links from this source
+            pdf_links = extract_pdf_links(markdown, links, source_url)
+            result['pdf_links'].extend(pdf_links)
+            
+            # Filter non-PDF links for regular processing
+            filtered_links = []
+            for link in links:
+                if filter_link(link) and not is_pdf_link(link):
+                    filtered_links.append(link)
+                    if len(filtered_links) == 5:
+                        break
+            
+            # Process main HTML page
+            content_hash = compute_hash(markdown)
+            existing = await db.items.find_one({"url": source_url}, {"_id": 0, "content_hash": 1})
+            is_new = existing is None
+            is_updated = existing and existing.get('content_hash') != content_hash
+            
+            if is_new or is_updated:
+                item = Item(
+                    source_id=source_id,
+                    url=source_url,
+                    title=title,
+                    content_text=markdown[:50000],
+                    content_type="html",
+                    content_hash=content_hash,
+                    fetched_at=now,
+                    last_seen_at=now
+                )
+                item_doc = item.model_dump(mode='json')
+                
+                if is_new:
+                    item_ops.append(UpdateOne({"url": source_url}, {"$set": item_doc}, upsert=True))
+                    counts['items_new'] += 1
+                else:
+                    item_ops.append(UpdateOne({"url": source_url}, {"$set": item_doc}))
+                    counts['items_updated'] += 1
+                
+                pending_classification.append({
+                    "content": item.content_text,
+                    "content_hash": content_hash,
+                    "url": source_url,
+                    "title": title,
+                    "item_id": item.id
+                })
+            else:
+                counts['items_unchanged'] += 1
+                item_ops.append(UpdateOne(
+                    {"url": source_url},
+                    {"$set": {"last_seen_at": now.isoformat()}}
+                ))
+            
+            counts['items_total'] += 1
+            
+            # Process non-PDF child links concurrently (limit to 2 per source)
+            async with asyncio.TaskGroup() as tg:
+                link_tasks = [
+                    tg.create_task(process_child_link(link_url, source_id, run_id, counts, item_ops, now))
+                    for link_url in filtered_links[:2]
+                ]
+            pending_classification.extend(t.result() for t in link_tasks if t.result())
+        
+        # Classify the main page and child links in one batched request
+        source_events = await create_events_from_items(run_id, pending_classification)
+        result['events'].extend(source_events)
+        counts['events_created'] += len(source_events)
+        
+        # Remember HTTP validators so the next run can skip an unchanged page. A cached copy may
+        # predate them, and pairing it with new validators would hide the change from later runs.
+        if validators and scraped_fresh:
+            await db.sources.update_one({"id": source_id}, {"$set": validators})
+        
+        counts['sources_ok'] += 1
+        source_success = True
+        
+    except Exception as e:
+        counts['sources_failed'] += 1
+        source_error = str(e)
+        await log_run(run_id, "error", f"Failed to process source: {source_name}", {"error": str(e)})
+    
+    # Flush item writes collected for this source
+    if item_ops:
+        try:
+            await db.items.bulk_write(item_ops, ordered=False)
+        except Exception as write_error:
+            await log_run(run_id, "error", f"Failed to store items for source: {source_name}", {"error": str(write_error)})
+    
+    # Log source health
+    end_time = _utc_now()
+    response_time_ms = (end_time - start_time).total_seconds() * 1000
+    
+    health_doc = {
+        "id": str(uuid.uuid4()),
+        "source_id": source_id,
+        "source_name": source_name,
+        "run_id": run_id,
+        "success": source_success,
+        "error": source_error,
+        "response_time_ms": response_time_ms,
+        "checked_at": end_time.isoformat()
+    }
+    result['health'] = health_doc
+    
+    return result
+
+def source_health_counter_update(health_doc: Dict) -> UpdateOne:
+    """Fold one health check into the running counters kept on the source document"""
+    response_time_ms = health_doc['response_time_ms']
+    if health_doc['success']:
+        latest = {"health.last_success_at": health_doc['checked_at']}
+    else:
+        latest = {"health.last_failure_at": health_doc['checked_at'], "health.last_error": health_doc['error']}
+    return UpdateOne(
+        {"id": health_doc['source_id']},
+        {
+            "$inc": {
+                "health.total": 1,
+                "health.successes": 1 if health_doc['success'] else 0,
+                "health.sum_response_ms": response_time_ms,
+                "health.timed_runs": 1 if response_time_ms else 0
+            },
+            "$set": latest
+        }
+    )
+
+async def process_child_link(link_url: str, source_id: str, run_id: str, counts: Dict[str, int], item_ops: List, now: datetime) -> Optional[Dict]:
+    """Crawl one child link and queue its item write. Returns a pending classification entry if its content changed."""
+    pending = None
+    try:
+        async with CHILD_SCRAPE_SEMAPHORE:
+            link_result = await firecrawl.scrape(link_url, **CHILD_SCRAPE_OPTIONS)
+        if link_result:
+            if hasattr(link_result, 'markdown'):
+                link_markdown = link_result.markdown or ''
+                link_title = getattr(link_result.metadata, 'title', link_url) if hasattr(link_result, 'metadata') and link_result.metadata else link_url
+            else:
+                link_markdown = link_result.get('markdown', '')
+                link_title = link_result.get('metadata', {}).get('title', link_url)
+            
+            link_hash = compute_hash(link_markdown)
+            link_existing = await db.items.find_one({"url": link_url}, {"_id": 0, "content_hash": 1})
+            
+            if not link_existing or link_existing.get('content_hash') != link_hash:
+                link_item = Item(
+                    source_id=source_id,
+                    url=link_url,
+                    title=link_title,
+                    content_text=link_markdown[:50000],
+                    content_type="html",
+                    content_hash=link_hash,
+                    fetched_at=now,
+                    last_seen_at=now
+                )
+                link_doc = link_item.model_dump(mode='json')
+                
+                item_ops.append(UpdateOne({"url": link_url}, {"$set": link_doc}, upsert=True))
+                counts['items_new'] += 1
+                
+                pending = {
+                    "content": link_item.content_text,
+                    "content_hash": link_hash,
+                    "url": link_url,
+                    "title": link_title,
+                    "item_id": link_item.id
+                }
+            
+            counts['items_total'] += 1
+    except Exception as link_error:
+        await log_run(run_id, "warn", f"Failed to process link: {link_url}", {"error": str(link_error)})
+    
+    return pending
+
 async def run_pipeline(run_id: str):
     """Execute the full intelligence pipeline with PDF extraction."""
     
@@ -615,213 +1087,58 @@ async def run_pipeline(run_id: str):
     all_events = []
     all_pdf_links = []  # Collect PDF links from all sources
     
-    # Phase 1: Crawl all sources and collect PDF links
-    for source in sources:
-        source_id = source['id']
-        source_url = source['url']
-        source_name = source['name']
-        
-        await log_run(run_id, "info", f"Processing source: {source_name}", {"url": source_url})
-        
-        start_time = datetime.now(timezone.utc)
-        source_success = False
-        source_error = None
-        is_source_pdf = is_pdf_link(source_url)
-        
-        try:
-            if is_source_pdf:
-                # Source URL is itself a PDF - use Reducto
-                pdf_result = await process_pdf_with_reducto(source_url, run_id)
-                if pdf_result:
-                    markdown = pdf_result['markdown']
-                    title = source_name
-                    links = []
-                    
-                    # Store item
-                    content_hash = compute_hash(markdown)
-                    item = Item(
-                        source_id=source_id,
-                        url=source_url,
-                        title=title,
-                        content_text=markdown[:50000],
-                        content_type="pdf",
-                        content_hash=content_hash
-                    )
-                    item_doc = item.model_dump()
-                    item_doc['fetched_at'] = item_doc['fetched_at'].isoformat()
-                    item_doc['last_seen_at'] = item_doc['last_seen_at'].isoformat()
-                    item_doc['is_pdf'] = True
-                    
-                    await db.items.update_one({"url": source_url}, {"$set": item_doc}, upsert=True)
-                    run_data['items_new'] += 1
-                    run_data['pdfs_processed'] += 1
-                    
-                    # Classify PDF content
-                    classification = await classify_content(markdown, source_url, title)
-                    if classification:
-                        classification['is_pdf_source'] = True
-                        classification['pdf_source_url'] = source_url
-                        event = Event(run_id=run_id, item_id=item.id, **classification)
-                        event_doc = event.model_dump()
-                        event_doc['created_at'] = event_doc['created_at'].isoformat()
-                        await db.events.insert_one(event_doc)
-                        all_events.append(event_doc)
-                        run_data['events_created'] += 1
-                else:
-                    raise Exception("Failed to parse PDF source")
-            else:
-                # Crawl HTML page with Firecrawl
-                crawl_result = await asyncio.to_thread(
-                    firecrawl.scrape,
-                    source_url,
-                    formats=['markdown', 'links']
-                )
-                
-                if not crawl_result:
-                    raise Exception("Empty crawl result")
-                
-                # Handle Firecrawl Document object
-                if hasattr(crawl_result, 'markdown'):
-                    markdown = crawl_result.markdown or ''
-                    title = getattr(crawl_result.metadata, 'title', source_name) if hasattr(crawl_result, 'metadata') and crawl_result.metadata else source_name
-                    links = getattr(crawl_result, 'links', []) or []
-                else:
-                    markdown = crawl_result.get('markdown', '')
-                    title = crawl_result.get('metadata', {}).get('title', source_name)
-                    links = crawl_result.get('links', [])
-                
-                # Extract PDF links from this source
-                pdf_links = extract_pdf_links(markdown, links, source_url)
-                for pdf_link in pdf_links:
-                    if pdf_link not in all_pdf_links:
-                        all_pdf_links.append(pdf_link)
-                        await log_run(run_id, "info", f"Found PDF link: {pdf_link}")
-                
-                # Filter non-PDF links for regular processing
-                filtered_links = [link for link in links if filter_link(link) and not is_pdf_link(link)][:5]
-                
-                # Process main HTML page
-                content_hash = compute_hash(markdown)
-                existing = await db.items.find_one({"url": source_url}, {"_id": 0})
-                is_new = existing is None
-                is_updated = existing and existing.get('content_hash') != content_hash
-                
-                if is_new or is_updated:
-                    item = Item(
-                        source_id=source_id,
-                        url=source_url,
-                        title=title,
-                        content_text=markdown[:50000],
-                        content_type="html",
-                        content_hash=content_hash
-                    )
-                    item_doc = item.model_dump()
-                    item_doc['fetched_at'] = item_doc['fetched_at'].isoformat()
-                    item_doc['last_seen_at'] = item_doc['last_seen_at'].isoformat()
-                    
-                    if is_new:
-                        await db.items.insert_one(item_doc)
-                        run_data['items_new'] += 1
-                    else:
-                        await db.items.update_one({"url": source_url}, {"$set": item_doc})
-                        run_data['items_updated'] += 1
-                    
-                    classification = await classify_content(markdown, source_url, title)
-                    if classification:
-                        event = Event(run_id=run_id, item_id=item.id, **classification)
-                        event_doc = event.model_dump()
-                        event_doc['created_at'] = event_doc['created_at'].isoformat()
-                        await db.events.insert_one(event_doc)
-                        all_events.append(event_doc)
-                        run_data['events_created'] += 1
-                else:
-                    run_data['items_unchanged'] += 1
-                    await db.items.update_one(
-                        {"url": source_url},
-                        {"$set": {"last_seen_at": datetime.now(timezone.utc).isoformat()}}
-                    )
-                
-                run_data['items_total'] += 1
-                
-                # Process non-PDF child links (limit to 2 per source)
-                for link_url in filtered_links[:2]:
-                    try:
-                        link_result = await asyncio.to_thread(
-                            firecrawl.scrape,
-                            link_url,
-                            formats=['markdown']
-                        )
-                        if link_result:
-                            if hasattr(link_result, 'markdown'):
-                                link_markdown = link_result.markdown or ''
-                                link_title = getattr(link_result.metadata, 'title', link_url) if hasattr(link_result, 'metadata') and link_result.metadata else link_url
-                            else:
-                                link_markdown = link_result.get('markdown', '')
-                                link_title = link_result.get('metadata', {}).get('title', link_url)
-                            
-                            link_hash = compute_hash(link_markdown)
-                            link_existing = await db.items.find_one({"url": link_url}, {"_id": 0})
-                            
-                            if not link_existing or link_existing.get('content_hash') != link_hash:
-                                link_item = Item(
-                                    source_id=source_id,
-                                    url=link_url,
-                                    title=link_title,
-                                    content_text=link_markdown[:50000],
-                                    content_type="html",
-                                    content_hash=link_hash
-                                )
-                                link_doc = link_item.model_dump()
-                                link_doc['fetched_at'] = link_doc['fetched_at'].isoformat()
-                                link_doc['last_seen_at'] = link_doc['last_seen_at'].isoformat()
-                                
-                                await db.items.update_one({"url": link_url}, {"$set": link_doc}, upsert=True)
-                                run_data['items_new'] += 1
-                                
-                                link_classification = await classify_content(link_markdown, link_url, link_title)
-                                if link_classification:
-                                    link_event = Event(run_id=run_id, item_id=link_item.id, **link_classification)
-                                    link_event_doc = link_event.model_dump()
-                                    link_event_doc['created_at'] = link_event_doc['created_at'].isoformat()
-                                    await db.events.insert_one(link_event_doc)
-                                    all_events.append(link_event_doc)
-                                    run_data['events_created'] += 1
-                            
-                            run_data['items_total'] += 1
-                    except Exception as link_error:
-                        await log_run(run_id, "warn", f"Failed to process link: {link_url}", {"error": str(link_error)})
-            
-            run_data['sources_ok'] += 1
-            source_success = True
-            
-        except Exception as e:
-            run_data['sources_failed'] += 1
-            source_error = str(e)
-            await log_run(run_id, "error", f"Failed to process source: {source_name}", {"error": str(e)})
-        
-        # Log source health
-        end_time = datetime.now(timezone.utc)
-        response_time_ms = (end_time - start_time).total_seconds() * 1000
-        
-        health_doc = {
-            "id": str(uuid.uuid4()),
-            "source_id": source_id,
-            "source_name": source_name,
-            "run_id": run_id,
-            "success": source_success,
-            "error": source_error,
-            "response_time_ms": response_time_ms,
-            "checked_at": end_time.isoformat()
-        }
-        await db.source_health.insert_one(health_doc)
+    # Phase 1: Skip HTML sources whose server reports no change, batch-fetch the rest,
+    # then process sources concurrently
+    html_sources = [source for source in sources if not is_pdf_link(source['url'])]
+    checks = await asyncio.gather(*[check_source_unchanged(source) for source in html_sources])
+    validators_by_url = {source['url']: check for source, check in zip(html_sources, checks)}
+    not_modified_urls = {url for url, (unchanged, _) in validators_by_url.items() if unchanged}
+    
+    prefetched = await batch_scrape_sources(
+        [source['url'] for source in html_sources if source['url'] not in not_modified_urls],
+        run_id
+    )
+    
+    async def bounded(source: Dict) -> Dict:
+        url = source['url']
+        async with SOURCE_SEMAPHORE:
+            return await process_source(
+                source, run_id, prefetched.get(url),
+                not_modified=url in not_modified_urls,
+                validators=validators_by_url.get(url, (False, {}))[1]
+            )
+    
+    source_results = await asyncio.gather(*[bounded(source) for source in sources])
+    
+    health_docs = [source_result['health'] for source_result in source_results]
+    if health_docs:
+        await asyncio.gather(
+            db.source_health.insert_many(health_docs, ordered=False),
+            db.sources.bulk_write([source_health_counter_update(doc) for doc in health_docs], ordered=False)
+        )
+    
+    # Merge per-source results in source order so PDF link priority stays stable
+    for source_result in source_results:
+        for key, value in source_result['counts'].items():
+            run_data[key] += value
+        all_events.extend(source_result['events'])
+        for pdf_link in source_result['pdf_links']:
+            if pdf_link not in all_pdf_links:
+                all_pdf_links.append(pdf_link)
+                await log_run(run_id, "info", f"Found PDF link: {pdf_link}")
     
     # Phase 2: Process collected PDF links (ensure at least 2 PDFs)
     await log_run(run_id, "info", f"Found {len(all_pdf_links)} total PDF links to process")
     
+    # Nothing changed anywhere: the fallback PDFs were already parsed on an earlier run
+    nothing_changed = bool(sources) and len(not_modified_urls) == len(sources)
+    
     # Ensure we process at least 2 PDFs (up to 5 max)
-    min_pdfs = 2
+    min_pdfs = 0 if nothing_changed else 2
     max_pdfs = 5
     pdfs_to_process = all_pdf_links[:max_pdfs]
+    if nothing_changed:
+        await log_run(run_id, "info", "No source changed since last run, skipping fallback PDFs")
     
     # If we don't have enough PDFs from links, add known working fallback PDFs
     # These have been tested to work with Reducto
@@ -839,6 +1156,9 @@ async def run_pipeline(run_id: str):
     
     await log_run(run_id, "info", f"Processing {len(pdfs_to_process)} PDFs with Reducto")
     
+    pending_pdfs = []
+    pdf_item_ops = []
+    now = _utc_now()
     for pdf_url in pdfs_to_process:
         try:
             pdf_result = await process_pdf_with_reducto(pdf_url, run_id)
@@ -855,50 +1175,54 @@ async def run_pipeline(run_id: str):
                     title=f"PDF: {pdf_title}",
                     content_text=pdf_markdown[:50000],
                     content_type="pdf",
-                    content_hash=content_hash
+                    content_hash=content_hash,
+                    fetched_at=now,
+                    last_seen_at=now
                 )
-                item_doc = item.model_dump()
-                item_doc['fetched_at'] = item_doc['fetched_at'].isoformat()
-                item_doc['last_seen_at'] = item_doc['last_seen_at'].isoformat()
+                item_doc = item.model_dump(mode='json')
                 item_doc['is_pdf'] = True
                 item_doc['tables_count'] = pdf_result.get('tables_count', 0)
                 item_doc['figures_count'] = pdf_result.get('figures_count', 0)
                 
-                await db.items.update_one({"url": pdf_url}, {"$set": item_doc}, upsert=True)
+                pdf_item_ops.append(UpdateOne({"url": pdf_url}, {"$set": item_doc}, upsert=True))
                 run_data['items_new'] += 1
                 run_data['pdfs_processed'] += 1
                 run_data['items_total'] += 1
                 
-                # Classify PDF content
-                classification = await classify_content(pdf_markdown, pdf_url, pdf_title)
-                
-                if classification:
-                    # Mark as PDF-sourced content
-                    classification['is_pdf_source'] = True
-                    classification['pdf_source_url'] = pdf_url
-                    
-                    event = Event(
-                        run_id=run_id,
-                        item_id=item.id,
-                        is_pdf_source=True,
-                        pdf_source_url=pdf_url,
-                        **classification
-                    )
-                    event_doc = event.model_dump()
-                    event_doc['created_at'] = event_doc['created_at'].isoformat()
-                    await db.events.insert_one(event_doc)
-                    all_events.append(event_doc)
-                    run_data['events_created'] += 1
-                    
-                    await log_run(run_id, "info", f"Successfully processed PDF: {pdf_url}", {
-                        "title": pdf_title,
-                        "chars": len(pdf_markdown),
-                        "tables": pdf_result.get('tables_count', 0)
-                    })
+                # Queue for batched classification, marked as PDF-sourced content
+                pending_pdfs.append({
+                    "content": item.content_text,
+                    "content_hash": content_hash,
+                    "url": pdf_url,
+                    "title": pdf_title,
+                    "item_id": item.id,
+                    "extra": {"is_pdf_source": True, "pdf_source_url": pdf_url},
+                    "chars": len(pdf_markdown),
+                    "tables": pdf_result.get('tables_count', 0)
+                })
                     
         except Exception as pdf_error:
             await log_run(run_id, "warn", f"Failed to process PDF: {pdf_url}", {"error": str(pdf_error)})
     
+    try:
+        if pdf_item_ops:
+            await db.items.bulk_write(pdf_item_ops, ordered=False)
+        
+        pdf_events = await create_events_from_items(run_id, pending_pdfs)
+        all_events.extend(pdf_events)
+        run_data['events_created'] += len(pdf_events)
+        
+        pending_by_url = {p['url']: p for p in pending_pdfs}
+        for event_doc in pdf_events:
+            pending = pending_by_url[event_doc['pdf_source_url']]
+            await log_run(run_id, "info", f"Successfully processed PDF: {pending['url']}", {
+                "title": pending['title'],
+                "chars": pending['chars'],
+                "tables": pending['tables']
+            })
+    except Exception as pdf_error:
+        await log_run(run_id, "warn", "Failed to store or classify PDFs", {"error": str(pdf_error)})
+    
     await log_run(run_id, "info", f"PDF processing complete. Processed {run_data['pdfs_processed']} PDFs")
     
     # Determine final status
@@ -925,17 +1249,20 @@ async def run_pipeline(run_id: str):
             "html": html_brief,
             "events": clean_events,
             "pdfs_processed": run_data['pdfs_processed'],
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": _utc_now().isoformat()
         }
         await db.briefs.insert_one(brief_doc)
+        await invalidate_briefs_cache()
         
         # Send email
         if await send_brief_email(html_brief, run_data_for_brief):
             emails_sent = 1
     else:
-        # If no new events, send the latest available brief
+        # If no new events, send the latest available brief as stored - no re-rendering
         await log_run(run_id, "info", "No new events detected, sending latest available brief")
-        latest_brief = await db.briefs.find_one({}, {"_id": 0}, sort=[("created_at", -1)])
+        latest_brief = await db.briefs.find_one(
+            {}, {"_id": 0, "html": 1, "created_at": 1}, sort=[("created_at", -1)]
+        )
         if latest_brief:
             # Send the latest brief with current run stats
             run_data_for_brief = {**run_data, "status": status}
@@ -949,10 +1276,11 @@ async def run_pipeline(run_id: str):
         {"$set": {
             **run_data,
             "status": status,
-            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "finished_at": _utc_now().isoformat(),
             "emails_sent": emails_sent
         }}
     )
+    await stats_cache.clear()
     
     # Generate agentic insights if events were created
     if all_events and len(all_events) > 0:
@@ -974,6 +1302,89 @@ async def run_pipeline(run_id: str):
             await log_run(run_id, "error", f"Agentic insights error: {str(e)}")
     
     await log_run(run_id, "info", f"Pipeline completed with status: {status}", run_data)
+    await flush_run_logs()
+
+# ========================
+# RUN QUEUE
+# ========================
+
+# Triggered runs wait here and a fixed pool of workers executes them, bounding pipeline concurrency
+PIPELINE_WORKERS = 2
+RUN_QUEUE_MAXSIZE = 100
+run_queue: asyncio.Queue = asyncio.Queue(maxsize=RUN_QUEUE_MAXSIZE)
+
+# Long-poll support for GET /runs/{id}?wait=: waiters block on the run's event until a worker finishes it.
+# They also re-read the run periodically, so runs finished by another process are still noticed.
+# Weak values: an event nobody waits on any more (run queued elsewhere, or already popped) is dropped.
+RUN_WAIT_MAX_SECONDS = 300
+RUN_WAIT_RECHECK_SECONDS = 5
+# Statuses of runs that have not finished yet
+RUN_ACTIVE_STATUSES = ("queued", "running")
+_run_finished: "weakref.WeakValueDictionary[str, asyncio.Event]" = weakref.WeakValueDictionary()
+
+async def pipeline_worker():
+    """Execute queued runs one at a time"""
+    while True:
+        run_id = await run_queue.get()
+        try:
+            await db.runs.update_one({"id": run_id, "status": "queued"}, {"$set": {"status": "running"}})
+            await stats_cache.clear()
+            await run_pipeline(run_id)
+        except Exception as e:
+            logger.error(f"Pipeline worker error for run {run_id}: {e}")
+            await db.runs.update_one(
+                {"id": run_id, "status": {"$in": list(RUN_ACTIVE_STATUSES)}},
+                {"$set": {"status": "failure", "finished_at": _utc_now().isoformat()}}
+            )
+        finally:
+            finished = _run_finished.pop(run_id, None)
+            if finished:
+                finished.set()
+            run_queue.task_done()
+
+async def enqueue_run(scheduled_run_id: Optional[str] = None) -> Optional[str]:
+    """Create a run record and queue it for execution; returns None when the queue is full"""
+    if run_queue.full():
+        return None
+    run = Run()
+    run_doc = run.model_dump(mode='json')
+    if scheduled_run_id:
+        run_doc['scheduled_run_id'] = scheduled_run_id
+    await db.runs.insert_one(run_doc)
+    try:
+        run_queue.put_nowait(run.id)
+    except asyncio.QueueFull:
+        # Another request took the last slot while the record was being written
+        await db.runs.delete_one({"id": run.id})
+        return None
+    await stats_cache.clear()
+    return run.id
+
+async def fail_interrupted_runs():
+    """Mark runs left queued or running by a previous process as failed; their queue did not survive"""
+    result = await db.runs.update_many(
+        {"status": {"$in": list(RUN_ACTIVE_STATUSES)}},
+        {"$set": {"status": "failure", "finished_at": _utc_now().isoformat()}}
+    )
+    if result.modified_count:
+        logger.warning(f"Marked {result.modified_count} interrupted runs as failed")
+
+# ========================
+# API RESPONSE CACHE
+# ========================
+
+# Low-volatility read endpoints are served from memory; writes clear the affected caches
+stats_cache = LRUCache(maxsize=1, ttl=60)
+sources_cache = LRUCache(maxsize=1, ttl=30)
+briefs_cache = LRUCache(maxsize=64, ttl=120)
+
+async def invalidate_sources_cache():
+    await sources_cache.clear()
+    await stats_cache.clear()
+
+async def invalidate_briefs_cache():
+    await briefs_cache.clear()
+    await stats_cache.clear()
 
 # ========================
 # API ENDPOINTS
@@ -984,50 +1395,82 @@ async def root():
     return {"message": "SafarAI Intelligence Platform API"}
 
 @api_router.post("/run")
-async def trigger_run(background_tasks: BackgroundTasks):
+async def trigger_run():
     """Trigger a new intelligence pipeline run."""
-    run = Run()
-    run_doc = run.model_dump()
-    run_doc['started_at'] = run_doc['started_at'].isoformat()
-    await db.runs.insert_one(run_doc)
-    
-    background_tasks.add_task(run_pipeline, run.id)
+    run_id = await enqueue_run()
+    if not run_id:
+        raise HTTPException(status_code=503, detail="Run queue is full, try again later")
     
-    return {"run_id": run.id, "status": "started", "message": "Pipeline execution started"}
+    return {"run_id": run_id, "status": "started", "message": "Pipeline execution started"}
 
 @api_router.get("/brief/latest")
 async def get_latest_brief():
     """Get the most recent executive briefing."""
+    cached = await briefs_cache.get("latest")
+    if cached is not None:
+        return cached
+    
     brief = await db.briefs.find_one({}, {"_id": 0}, sort=[("created_at", -1)])
     if not brief:
         return {"message": "No briefs available yet", "brief": None}
+    await briefs_cache.set("latest", brief)
     return brief
 
-@api_router.get("/sources")
+# List endpoints return only the fields their views render; detail endpoints return full documents
+SOURCE_LIST_PROJECTION = {"_id": 0, "id": 1, "name": 1, "url": 1, "category": 1, "active": 1, "created_at": 1}
+RUN_LOG_LIST_PROJECTION = {"_id": 0, "id": 1, "level": 1, "message": 1, "meta": 1, "created_at": 1}
+ACTION_ITEM_LIST_PROJECTION = {
+    "_id": 0, "id": 1, "run_id": 1, "title": 1, "description": 1, "priority": 1, "status": 1,
+    "assigned_to": 1, "assigned_role": 1, "due_date": 1, "created_at": 1, "completed_at": 1
+}
+# Fetched in a single batch instead of Motor's default 101-document first batch plus getMores
+RUN_LOG_FETCH_LIMIT = 500
+# Upper bound on the page size of paginated list endpoints
+MAX_PAGE_SIZE = 100
+TREND_LIST_PROJECTION = {
+    "_id": 0, "id": 1, "run_id": 1, "trend_category": 1, "trend_name": 1, "description": 1,
+    "forecast_horizon": 1, "confidence": 1, "key_indicators": 1, "potential_impact": 1,
+    "recommended_actions": 1, "created_at": 1
+}
+
+@api_router.get("/sources", response_model=SourcesResponse)
 async def list_sources():
     """List all configured sources."""
-    sources = await db.sources.find({}, {"_id": 0}).to_list(100)
-    return {"sources": sources}
+    cached = await sources_cache.get("all")
+    if cached is not None:
+        return cached
+    
+    sources = await db.sources.find({}, SOURCE_LIST_PROJECTION).to_list(100)
+    response = {"sources": sources}
+    await sources_cache.set("all", response)
+    return response
 
 @api_router.post("/sources")
 async def create_source(source_data: SourceCreate):
     """Add a new source to monitor."""
     source = Source(**source_data.model_dump())
     doc = source.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
     await db.sources.insert_one(doc)
+    await invalidate_sources_cache()
     return source
 
 @api_router.patch("/sources/{source_id}")
 async def update_source(source_id: str, update_data: SourceUpdate):
     """Update source configuration."""
-    update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
+    # None of the source fields are nullable, so an explicit null is ignored like an omitted field
+    update_dict = update_data.model_dump(exclude_unset=True, exclude_none=True)
     if not update_dict:
         raise HTTPException(status_code=400, detail="No update data provided")
     
+    if 'url' in update_dict:
+        # Validators from the old URL must not mark the new one unchanged
+        update_dict['http_etag'] = None
+        update_dict['http_last_modified'] = None
+    
     result = await db.sources.update_one({"id": source_id}, {"$set": update_dict})
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Source not found")
+    await invalidate_sources_cache()
     
     updated = await db.sources.find_one({"id": source_id}, {"_id": 0})
     return updated
@@ -1038,6 +1481,7 @@ async def delete_source(source_id: str):
     result = await db.sources.delete_one({"id": source_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Source not found")
+    await invalidate_sources_cache()
     return {"message": "Source deleted"}
 
 @api_router.get("/runs/latest")
@@ -1049,49 +1493,98 @@ async def get_latest_run():
     return run
 
 @api_router.get("/runs/{run_id}")
-async def get_run(run_id: str):
-    """Get a specific run by ID."""
+async def get_run(run_id: str, wait: float = 0):
+    """Get a specific run by ID. With wait=N, block up to N seconds until a queued or running run finishes."""
     run = await db.runs.find_one({"id": run_id}, {"_id": 0})
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
+    
+    if wait > 0 and run.get('status') in RUN_ACTIVE_STATUSES:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(wait, RUN_WAIT_MAX_SECONDS)
+        finished = _run_finished.setdefault(run_id, asyncio.Event())
+        while run and run.get('status') in RUN_ACTIVE_STATUSES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(finished.wait(), timeout=min(remaining, RUN_WAIT_RECHECK_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+            run = await db.runs.find_one({"id": run_id}, {"_id": 0})
+            if finished.is_set():
+                # The worker is done with this run even if it never reached a terminal status
+                break
+        if not run:
+            raise HTTPException(status_code=404, detail="Run not found")
+    
     return run
 
-@api_router.get("/logs/latest")
+@api_router.get("/logs/latest", response_model=RunLogsResponse, response_model_exclude_unset=True)
 async def get_latest_logs():
     """Get logs from the most recent run."""
-    latest_run = await db.runs.find_one({}, {"_id": 0}, sort=[("started_at", -1)])
-    if not latest_run:
+    # Latest run and its logs in one round trip
+    latest = await db.runs.aggregate([
+        {"$sort": {"started_at": -1}},
+        {"$limit": 1},
+        {"$lookup": {
+            "from": "run_logs",
+            "let": {"run_id": "$id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$run_id", "$$run_id"]}}},
+                {"$sort": {"created_at": 1}},
+                {"$limit": RUN_LOG_FETCH_LIMIT},
+                {"$project": RUN_LOG_LIST_PROJECTION}
+            ],
+            "as": "logs"
+        }},
+        {"$project": {"_id": 0, "id": 1, "logs": 1}}
+    ]).to_list(1)
+    if not latest:
         return {"logs": [], "message": "No runs yet"}
     
-    logs = await db.run_logs.find(
-        {"run_id": latest_run['id']},
-        {"_id": 0}
-    ).sort("created_at", 1).to_list(500)
+    return {"run_id": latest[0]['id'], "logs": latest[0]['logs']}
+
+@api_router.get("/logs/{run_id}", response_model=RunLogsResponse, response_model_exclude_unset=True)
+async def get_run_logs(run_id: str, level: Optional[str] = None, contains: Optional[str] = None):
+    """Get logs for a specific run, optionally filtered by level and message substring."""
+    query = {"run_id": run_id}
+    if level:
+        query["level"] = level
+    if contains:
+        query["message"] = {"$regex": re.escape(contains)}
     
-    return {"run_id": latest_run['id'], "logs": logs}
-
-@api_router.get("/logs/{run_id}")
-async def get_run_logs(run_id: str):
-    """Get logs for a specific run."""
     logs = await db.run_logs.find(
-        {"run_id": run_id},
+        query,
         {"_id": 0}
-    ).sort("created_at", 1).to_list(500)
+    ).sort("created_at", 1).limit(RUN_LOG_FETCH_LIMIT).batch_size(RUN_LOG_FETCH_LIMIT).to_list(RUN_LOG_FETCH_LIMIT)
     
     return {"run_id": run_id, "logs": logs}
 
 @api_router.get("/stats")
 async def get_stats():
     """Get overall platform statistics."""
-    total_sources = await db.sources.count_documents({})
-    active_sources = await db.sources.count_documents({"active": True})
-    total_runs = await db.runs.count_documents({})
-    total_events = await db.events.count_documents({})
-    total_items = await db.items.count_documents({})
+    cached = await stats_cache.get("stats")
+    if cached is not None:
+        return cached
     
-    latest_run = await db.runs.find_one({}, {"_id": 0}, sort=[("started_at", -1)])
+    # Both source counts in one aggregation; whole-collection counts come from metadata
+    source_counts_pipeline = [{"$facet": {
+        "total": [{"$count": "n"}],
+        "active": [{"$match": {"active": True}}, {"$count": "n"}]
+    }}]
+    source_counts, total_runs, total_events, total_items, latest_run = await asyncio.gather(
+        db.sources.aggregate(source_counts_pipeline).to_list(1),
+        db.runs.estimated_document_count(),
+        db.events.estimated_document_count(),
+        db.items.estimated_document_count(),
+        db.runs.find_one({}, {"_id": 0}, sort=[("started_at", -1)])
+    )
+    facet = source_counts[0] if source_counts else {}
+    total_sources = facet["total"][0]["n"] if facet.get("total") else 0
+    active_sources = facet["active"][0]["n"] if facet.get("active") else 0
     
-    return {
+    stats = {
         "total_sources": total_sources,
         "active_sources": active_sources,
         "total_runs": total_runs,
@@ -1099,6 +1592,8 @@ async def get_stats():
         "total_items": total_items,
         "latest_run": latest_run
     }
+    await stats_cache.set("stats", stats)
+    return stats
 
 # ========================
 # AGENTIC AI ENDPOINTS
@@ -1115,31 +1610,36 @@ async def get_team():
 async def add_team_member(member_data: TeamMemberCreate):
     """Add a new team member"""
     member = TeamMember(**member_data.model_dump())
-    doc = member.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
+    doc = member.model_dump(mode='json')
     await db.team_members.insert_one(doc)
     return member
 
 # Action Items
 @api_router.get("/action-items")
-async def get_action_items(status: Optional[str] = None, run_id: Optional[str] = None):
-    """Get action items with optional filtering"""
+async def get_action_items(status: Optional[str] = None, run_id: Optional[str] = None, skip: int = 0, limit: int = MAX_PAGE_SIZE):
+    """Get action items with optional filtering and pagination"""
     query = {}
     if status:
         query["status"] = status
     if run_id:
         query["run_id"] = run_id
     
-    items = await db.action_items.find(query, {"_id": 0}).sort("created_at", -1).to_list(100)
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    items = await db.action_items.find(
+        query, ACTION_ITEM_LIST_PROJECTION, skip=max(skip, 0), limit=limit, batch_size=limit
+    ).sort("created_at", -1).to_list(limit)
     return {"action_items": items}
 
 @api_router.post("/action-items/{item_id}/complete")
 async def complete_action_item(item_id: str, update_data: ActionItemUpdate):
     """Mark action item as complete or update status"""
-    update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
+    # Only fields the client sent; an explicit null assigned_to unassigns the item
+    update_dict = update_data.model_dump(exclude_unset=True)
+    if not update_dict:
+        raise HTTPException(status_code=400, detail="No update data provided")
     
     if update_dict.get("status") == "completed":
-        update_dict["completed_at"] = datetime.now(timezone.utc).isoformat()
+        update_dict["completed_at"] = _utc_now()
     
     result = await db.action_items.update_one({"id": item_id}, {"$set": update_dict})
     if result.matched_count == 0:
@@ -1150,30 +1650,32 @@ async def complete_action_item(item_id: str, update_data: ActionItemUpdate):
 
 # Approvals
 @api_router.get("/approvals")
-async def get_approvals(status: Optional[str] = "pending"):
-    """Get approval requests"""
+async def get_approvals(status: Optional[str] = "pending", skip: int = 0, limit: int = MAX_PAGE_SIZE):
+    """Get approval requests with pagination"""
     query = {"status": status} if status else {}
-    approvals = await db.approvals.find(query, {"_id": 0}).sort("created_at", -1).to_list(100)
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    approvals = await db.approvals.find(
+        query, {"_id": 0}, skip=max(skip, 0), limit=limit, batch_size=limit
+    ).sort("created_at", -1).to_list(limit)
     return {"approvals": approvals}
 
 @api_router.post("/approvals/{approval_id}/approve")
-async def approve_action(approval_id: str, background_tasks: BackgroundTasks):
+async def approve_action(approval_id: str):
     """Approve and execute an action"""
-    approval = await db.approvals.find_one({"id": approval_id}, {"_id": 0})
-    if not approval:
-        raise HTTPException(status_code=404, detail="Approval not found")
-    
-    if approval["status"] != "pending":
-        raise HTTPException(status_code=400, detail="Approval already processed")
-    
-    # Update approval status
-    await db.approvals.update_one(
-        {"id": approval_id},
+    # Claim the pending approval atomically so concurrent approvals can't both execute
+    approval = await db.approvals.find_one_and_update(
+        {"id": approval_id, "status": "pending"},
         {"$set": {
             "status": "approved",
-            "approved_at": datetime.now(timezone.utc).isoformat()
-        }}
+            "approved_at": _utc_now()
+        }},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
     )
+    if not approval:
+        if await db.approvals.count_documents({"id": approval_id}, limit=1):
+            raise HTTPException(status_code=400, detail="Approval already processed")
+        raise HTTPException(status_code=404, detail="Approval not found")
     
     # Execute action in background
     action_type = approval["action_type"]
@@ -1188,8 +1690,8 @@ async def approve_action(approval_id: str, background_tasks: BackgroundTasks):
         source_data = parameters
         source = Source(**source_data)
         doc = source.model_dump()
-        doc['created_at'] = doc['created_at'].isoformat()
         await db.sources.insert_one(doc)
+        await invalidate_sources_cache()
     elif action_type == "export_csv":
         # Export data to CSV
         logger.info(f"Executing export_csv action: {parameters}")
@@ -1199,7 +1701,7 @@ async def approve_action(approval_id: str, background_tasks: BackgroundTasks):
         {"id": approval_id},
         {"$set": {
             "status": "executed",
-            "executed_at": datetime.now(timezone.utc).isoformat()
+            "executed_at": _utc_now()
         }}
     )
     
@@ -1212,7 +1714,7 @@ async def reject_action(approval_id: str):
         {"id": approval_id, "status": "pending"},
         {"$set": {
             "status": "rejected",
-            "approved_at": datetime.now(timezone.utc).isoformat()
+            "approved_at": _utc_now()
         }}
     )
     
@@ -1241,13 +1743,16 @@ async def get_insights_by_run(run_id: str):
 @api_router.post("/agentic/generate")
 async def generate_insights_endpoint(background_tasks: BackgroundTasks):
     """Generate agentic insights for the latest run"""
-    # Get latest run
-    latest_run = await db.runs.find_one({}, {"_id": 0}, sort=[("started_at", -1)])
+    # Get latest run and team members concurrently
+    latest_run, team_members = await asyncio.gather(
+        db.runs.find_one({}, {"_id": 0}, sort=[("started_at", -1)]),
+        db.team_members.find({}, {"_id": 0}).to_list(100)
+    )
     if not latest_run:
         raise HTTPException(status_code=404, detail="No runs found")
     
     # Get events for this run (or from latest brief if no events in run)
-    events = await db.events.find({"run_id": latest_run['id']}, {"_id": 0}).to_list(1000)
+    events = await db.events.find({"run_id": latest_run['id']}, {"_id": 0}, limit=1000, batch_size=1000).to_list(1000)
     
     # If no events for latest run, use all available events
     if not events:
@@ -1257,9 +1762,6 @@ async def generate_insights_endpoint(background_tasks: BackgroundTasks):
     if not events:
         raise HTTPException(status_code=400, detail="No events available in database")
     
-    # Get team members
-    team_members = await db.team_members.find({}, {"_id": 0}).to_list(100)
-    
     # Generate insights
     insight_id = await generate_agentic_insights(
         run_id=latest_run['id'],
@@ -1281,10 +1783,13 @@ async def generate_insights_endpoint(background_tasks: BackgroundTasks):
 
 # Trends
 @api_router.get("/trends")
-async def get_trends(run_id: Optional[str] = None):
-    """Get trend forecasts"""
+async def get_trends(run_id: Optional[str] = None, skip: int = 0, limit: int = MAX_PAGE_SIZE):
+    """Get trend forecasts with pagination"""
     query = {"run_id": run_id} if run_id else {}
-    trends = await db.trend_forecasts.find(query, {"_id": 0}).sort("created_at", -1).to_list(100)
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    trends = await db.trend_forecasts.find(
+        query, TREND_LIST_PROJECTION, skip=max(skip, 0), limit=limit, batch_size=limit
+    ).sort("created_at", -1).to_list(limit)
     return {"trends": trends}
 
 # ========================
@@ -1305,10 +1810,7 @@ async def process_pdf_endpoint(request: PDFProcessRequest, background_tasks: Bac
         await log_run("pdf-process", "info", f"Starting PDF processing: {request.url}")
         
         # Use Reducto to parse the PDF - input should be URL string directly
-        pdf_result = await asyncio.to_thread(
-            reducto_client.parse.run,
-            input=request.url
-        )
+        pdf_result = await reducto_client.parse.run(input=request.url)
         
         # Extract content from chunks
         extracted_content = []
@@ -1337,9 +1839,7 @@ async def process_pdf_endpoint(request: PDFProcessRequest, background_tasks: Bac
             content_hash=compute_hash(full_text)
         )
         
-        item_doc = item.model_dump()
-        item_doc['fetched_at'] = item_doc['fetched_at'].isoformat()
-        item_doc['last_seen_at'] = item_doc['last_seen_at'].isoformat()
+        item_doc = item.model_dump(mode='json')
         item_doc['tables_count'] = len(tables)
         item_doc['figures_count'] = len(figures)
         
@@ -1384,11 +1884,31 @@ async def get_reducto_status():
 # BRIEFS ENDPOINTS
 # ========================
 
-@api_router.get("/briefs")
+@api_router.get("/briefs", response_model=BriefsResponse)
 async def list_briefs(limit: int = 50):
     """Get all historical briefs"""
-    briefs = await db.briefs.find({}, {"_id": 0, "html": 0}).sort("created_at", -1).to_list(limit)
-    return {"briefs": briefs}
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    cache_key = f"list:{limit}"
+    cached = await briefs_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Summary rows only: html and events stay on the server, GET /brief/{id} returns them
+    briefs = await db.briefs.aggregate([
+        {"$sort": {"created_at": -1}},
+        {"$limit": limit},
+        {"$project": {
+            "_id": 0,
+            "id": 1,
+            "run_id": 1,
+            "pdfs_processed": 1,
+            "created_at": 1,
+            "event_count": {"$size": {"$ifNull": ["$events", []]}}
+        }}
+    ]).to_list(limit)
+    response = {"briefs": briefs}
+    await briefs_cache.set(cache_key, response)
+    return response
 
 @api_router.get("/brief/{brief_id}")
 async def get_brief_by_id(brief_id: str):
@@ -1398,59 +1918,68 @@ async def get_brief_by_id(brief_id: str):
         raise HTTPException(status_code=404, detail="Brief not found")
     return brief
 
+PDF_STREAM_CHUNK_BYTES = 64 * 1024
+# Built once; Paragraph only reads from the stylesheet
+PDF_STYLES = getSampleStyleSheet()
+
+def _build_pdf(brief: dict) -> io.BytesIO:
+    """Render a brief to PDF with reportlab (CPU-bound, run off the event loop)"""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    styles = PDF_STYLES
+    story = []
+    
+    # Title
+    title_style = styles['Heading1']
+    story.append(Paragraph("SafarAI Intelligence Brief", title_style))
+    story.append(Spacer(1, 12))
+    
+    # Date
+    date_str = brief.get('created_at', 'Unknown')
+    story.append(Paragraph(f"Generated: {date_str}", styles['Normal']))
+    story.append(Spacer(1, 24))
+    
+    # Events
+    events = brief.get('events', [])
+    for event in events[:20]:
+        event_type = event.get('event_type', 'other').replace('_', ' ').upper()
+        story.append(Paragraph(f"<b>[{event_type}]</b> {event.get('title', 'N/A')}", styles['Heading3']))
+        story.append(Paragraph(f"Company: {event.get('company', 'Unknown')}", styles['Normal']))
+        story.append(Paragraph(f"{event.get('summary', '')}", styles['Normal']))
+        story.append(Paragraph(f"<i>Why it matters:</i> {event.get('why_it_matters', '')}", styles['Normal']))
+        story.append(Spacer(1, 12))
+    
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
+
+async def _iter_pdf_chunks(buffer: io.BytesIO):
+    """Yield the rendered PDF in fixed-size chunks"""
+    while True:
+        chunk = buffer.read(PDF_STREAM_CHUNK_BYTES)
+        if not chunk:
+            break
+        yield chunk
+
 @api_router.get("/brief/{brief_id}/pdf")
 async def export_brief_to_pdf(brief_id: str):
     """Export brief to PDF"""
+    # Get brief
+    brief = await db.briefs.find_one({"id": brief_id}, {"_id": 0, "created_at": 1, "events": 1})
+    if not brief:
+        raise HTTPException(status_code=404, detail="Brief not found")
+    
     try:
-        # Get brief
-        brief = await db.briefs.find_one({"id": brief_id}, {"_id": 0})
-        if not brief:
-            raise HTTPException(status_code=404, detail="Brief not found")
-        
-        # Create a downloadable PDF using reportlab
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.units import inch
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-        
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-        styles = getSampleStyleSheet()
-        story = []
-        
-        # Title
-        title_style = styles['Heading1']
-        story.append(Paragraph("SafarAI Intelligence Brief", title_style))
-        story.append(Spacer(1, 12))
-        
-        # Date
-        date_str = brief.get('created_at', 'Unknown')
-        story.append(Paragraph(f"Generated: {date_str}", styles['Normal']))
-        story.append(Spacer(1, 24))
-        
-        # Events
-        events = brief.get('events', [])
-        for event in events[:20]:
-            event_type = event.get('event_type', 'other').replace('_', ' ').upper()
-            story.append(Paragraph(f"<b>[{event_type}]</b> {event.get('title', 'N/A')}", styles['Heading3']))
-            story.append(Paragraph(f"Company: {event.get('company', 'Unknown')}", styles['Normal']))
-            story.append(Paragraph(f"{event.get('summary', '')}", styles['Normal']))
-            story.append(Paragraph(f"<i>Why it matters:</i> {event.get('why_it_matters', '')}", styles['Normal']))
-            story.append(Spacer(1, 12))
-        
-        doc.build(story)
-        buffer.seek(0)
-        
-        return StreamingResponse(
-            buffer,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename=intel-brief-{brief_id[:8]}.pdf"}
-        )
-        
+        buffer = await asyncio.to_thread(_build_pdf, brief)
     except Exception as e:
         logger.error(f"PDF export error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
+    
+    return StreamingResponse(
+        _iter_pdf_chunks(buffer),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename=intel-brief-{brief_id[:8]}.pdf"}
+    )
 
 # ========================
 # SCHEDULED RUNS ENDPOINTS
@@ -1460,48 +1989,108 @@ async def export_brief_to_pdf(brief_id: str):
 scheduler_running = False
 scheduler_task = None
 
+SCHEDULER_ERROR_BACKOFF_SECONDS = 60
+
+# Min-heap of (next_run_at, schedule_id). Entries may go stale when a schedule is disabled,
+# deleted or rescheduled; each popped entry is re-checked against the database before firing.
+_schedule_heap: List[Tuple[datetime, str]] = []
+# Set by the schedule endpoints so the scheduler re-plans instead of sleeping through a change
+_schedule_changed = asyncio.Event()
+
+def plan_schedule(schedule_id: str, next_run_at: datetime):
+    """Add a fire time to the scheduler heap and wake the scheduler"""
+    heapq.heappush(_schedule_heap, (next_run_at, schedule_id))
+    _schedule_changed.set()
+
+# Parsed cron expressions keyed by schedule id: {schedule_id: (cron_expression, croniter)}
+_cron_cache: Dict[str, Tuple[str, croniter]] = {}
+
+def next_schedule_time(schedule_id: str, cron_expression: str, now: datetime) -> datetime:
+    """Next fire time after now, reusing the schedule's parsed croniter"""
+    cached = _cron_cache.get(schedule_id)
+    if cached and cached[0] == cron_expression:
+        cron = cached[1]
+        cron.set_current(now)
+    else:
+        cron = croniter(cron_expression, now)
+        _cron_cache[schedule_id] = (cron_expression, cron)
+    return cron.get_next(datetime)
+
+async def migrate_schedule_dates():
+    """Convert legacy ISO-string next_run_at values to BSON dates"""
+    async for schedule in db.scheduled_runs.find({"next_run_at": {"$type": "string"}}, {"_id": 0, "id": 1, "next_run_at": 1}):
+        next_run_dt = datetime.fromisoformat(schedule['next_run_at'].replace('Z', '+00:00'))
+        await db.scheduled_runs.update_one({"id": schedule['id']}, {"$set": {"next_run_at": next_run_dt}})
+
+async def load_schedule_heap():
+    """Seed the scheduler heap from the enabled schedules"""
+    _schedule_heap.clear()
+    async for schedule in db.scheduled_runs.find(
+        {"enabled": True, "next_run_at": {"$type": "date"}}, {"_id": 0, "id": 1, "next_run_at": 1}
+    ):
+        _schedule_heap.append((schedule['next_run_at'], schedule['id']))
+    heapq.heapify(_schedule_heap)
+
+async def fire_schedule(schedule_id: str, now: datetime):
+    """Queue a run for a due schedule and plan its next occurrence"""
+    # The filter discards stale heap entries: disabled, deleted or already advanced schedules
+    schedule = await db.scheduled_runs.find_one(
+        {"id": schedule_id, "enabled": True, "next_run_at": {"$lte": now}}, {"_id": 0}
+    )
+    if not schedule:
+        return
+    
+    # Calculate next run time
+    next_time = next_schedule_time(schedule['id'], schedule['cron_expression'], now)
+    
+    # Advance next_run_at only if nobody else already has, so each occurrence fires once
+    claimed = await db.scheduled_runs.update_one(
+        {"id": schedule['id'], "next_run_at": schedule['next_run_at']},
+        {"$set": {
+            "last_run_at": now,
+            "next_run_at": next_time
+        }}
+    )
+    heapq.heappush(_schedule_heap, (next_time, schedule['id']))
+    if claimed.modified_count == 0:
+        return
+    
+    # Queue run
+    if not await enqueue_run(scheduled_run_id=schedule['id']):
+        logger.warning(f"Run queue full, skipping scheduled run: {schedule['name']}")
+        return
+    logger.info(f"Scheduled run executed: {schedule['name']}")
+
 async def check_scheduled_runs():
-    """Background task to check and execute scheduled runs"""
+    """Background task that sleeps until the next schedule is due, then executes it"""
     global scheduler_running
+    
+    try:
+        await migrate_schedule_dates()
+        await load_schedule_heap()
+    except Exception as e:
+        logger.error(f"Scheduler initialization failed: {e}")
+    
     while scheduler_running:
         try:
-            now = datetime.now(timezone.utc)
-            schedules = await db.scheduled_runs.find({"enabled": True}, {"_id": 0}).to_list(100)
+            _schedule_changed.clear()
+            now = _utc_now()
             
-            for schedule in schedules:
-                next_run = schedule.get('next_run_at')
-                if next_run:
-                    next_run_dt = datetime.fromisoformat(next_run.replace('Z', '+00:00')) if isinstance(next_run, str) else next_run
-                    if now >= next_run_dt:
-                        # Execute run
-                        run = Run()
-                        run_doc = run.model_dump()
-                        run_doc['started_at'] = run_doc['started_at'].isoformat()
-                        run_doc['scheduled_run_id'] = schedule['id']
-                        await db.runs.insert_one(run_doc)
-                        
-                        # Run pipeline in background
-                        asyncio.create_task(run_pipeline(run.id))
-                        
-                        # Calculate next run time
-                        from croniter import croniter
-                        cron = croniter(schedule['cron_expression'], now)
-                        next_time = cron.get_next(datetime)
-                        
-                        await db.scheduled_runs.update_one(
-                            {"id": schedule['id']},
-                            {"$set": {
-                                "last_run_at": now.isoformat(),
-                                "next_run_at": next_time.isoformat()
-                            }}
-                        )
-                        logger.info(f"Scheduled run executed: {schedule['name']}")
+            if _schedule_heap and _schedule_heap[0][0] <= now:
+                _, schedule_id = heapq.heappop(_schedule_heap)
+                await fire_schedule(schedule_id, now)
+                continue
             
-            await asyncio.sleep(60)  # Check every minute
+            # Sleep until the earliest fire time, or until a schedule endpoint signals a change
+            timeout = (_schedule_heap[0][0] - now).total_seconds() if _schedule_heap else None
+            try:
+                await asyncio.wait_for(_schedule_changed.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
             
         except Exception as e:
             logger.error(f"Scheduler error: {e}")
-            await asyncio.sleep(60)
+            await asyncio.sleep(SCHEDULER_ERROR_BACKOFF_SECONDS)
 
 @api_router.get("/schedules")
 async def list_schedules():
@@ -1513,25 +2102,24 @@ async def list_schedules():
 async def create_schedule(schedule_data: ScheduledRunCreate):
     """Create a new scheduled run"""
     try:
-        from croniter import croniter
-        
-        # Validate cron expression
-        now = datetime.now(timezone.utc)
-        cron = croniter(schedule_data.cron_expression, now)
-        next_run = cron.get_next(datetime)
-        
         schedule = ScheduledRun(
             cron_expression=schedule_data.cron_expression,
             name=schedule_data.name,
-            enabled=schedule_data.enabled,
-            next_run_at=next_run
+            enabled=schedule_data.enabled
         )
         
-        doc = schedule.model_dump()
-        doc['created_at'] = doc['created_at'].isoformat()
-        doc['next_run_at'] = doc['next_run_at'].isoformat() if doc['next_run_at'] else None
+        # Validate cron expression
+        now = _utc_now()
+        next_run = next_schedule_time(schedule.id, schedule.cron_expression, now)
+        schedule.next_run_at = next_run
+        
+        doc = schedule.model_dump(mode='json')
+        # Stored as a BSON date so the scheduler can range-query due schedules
+        doc['next_run_at'] = next_run
         
         await db.scheduled_runs.insert_one(doc)
+        if schedule.enabled:
+            plan_schedule(schedule.id, next_run)
         
         # Remove _id before returning
         doc.pop('_id', None)
@@ -1544,18 +2132,23 @@ async def create_schedule(schedule_data: ScheduledRunCreate):
 @api_router.patch("/schedules/{schedule_id}")
 async def update_schedule(schedule_id: str, enabled: bool):
     """Enable or disable a scheduled run"""
-    result = await db.scheduled_runs.update_one(
+    schedule = await db.scheduled_runs.find_one_and_update(
         {"id": schedule_id},
-        {"$set": {"enabled": enabled}}
+        {"$set": {"enabled": enabled}},
+        projection={"_id": 0, "next_run_at": 1}
     )
-    if result.matched_count == 0:
+    if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
+    # Disabled schedules drop out lazily when their heap entry is re-checked
+    if enabled and isinstance(schedule.get('next_run_at'), datetime):
+        plan_schedule(schedule_id, schedule['next_run_at'])
     return {"message": f"Schedule {'enabled' if enabled else 'disabled'}"}
 
 @api_router.delete("/schedules/{schedule_id}")
 async def delete_schedule(schedule_id: str):
     """Delete a scheduled run"""
     result = await db.scheduled_runs.delete_one({"id": schedule_id})
+    _cron_cache.pop(schedule_id, None)
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Schedule not found")
     return {"message": "Schedule deleted"}
@@ -1564,43 +2157,29 @@ async def delete_schedule(schedule_id: str):
 # SOURCE HEALTH MONITORING
 # ========================
 
-@api_router.get("/sources/health")
+@api_router.get("/sources/health", response_model=SourceHealthResponse)
 async def get_sources_health():
     """Get health metrics for all sources"""
-    sources = await db.sources.find({}, {"_id": 0}).to_list(100)
+    # Counters are maintained by run_pipeline; raw checks stay in source_health for history
     health_data = []
-    
-    for source in sources:
-        # Get source run history
-        source_logs = await db.source_health.find(
-            {"source_id": source['id']},
-            {"_id": 0}
-        ).sort("checked_at", -1).to_list(100)
-        
-        total = len(source_logs)
-        successes = len([log for log in source_logs if log.get('success')])
-        failures = total - successes
-        
-        last_success = next((log for log in source_logs if log.get('success')), None)
-        last_failure = next((log for log in source_logs if not log.get('success')), None)
-        
-        avg_response_time = 0
-        if source_logs:
-            response_times = [log.get('response_time_ms', 0) for log in source_logs if log.get('response_time_ms')]
-            avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+    async for source in db.sources.find({}, {"_id": 0, "id": 1, "name": 1, "health": 1}).limit(100):
+        health = source.get('health') or {}
+        total = health.get('total', 0)
+        successes = health.get('successes', 0)
+        timed_runs = health.get('timed_runs', 0)
         
         health_data.append(SourceHealth(
             source_id=source['id'],
             source_name=source['name'],
             total_runs=total,
             successful_runs=successes,
-            failed_runs=failures,
+            failed_runs=total - successes,
             success_rate=(successes / total * 100) if total > 0 else 0,
-            avg_response_time_ms=avg_response_time,
-            last_success_at=last_success.get('checked_at') if last_success else None,
-            last_failure_at=last_failure.get('checked_at') if last_failure else None,
-            last_error=last_failure.get('error') if last_failure else None
-        ).model_dump())
+            avg_response_time_ms=(health.get('sum_response_ms', 0) / timed_runs) if timed_runs > 0 else 0,
+            last_success_at=health.get('last_success_at'),
+            last_failure_at=health.get('last_failure_at'),
+            last_error=health.get('last_error')
+        ))
     
     return {"health": health_data}
 
@@ -1644,20 +2223,165 @@ async def send_test_email():
             """
         }
         
-        email = await asyncio.to_thread(resend.Emails.send, params)
+        email = await post_resend_email(params)
         return {"message": "Test email sent", "email_id": email.get('id')}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to send test email: {str(e)}")
 
-# Include router
-app.include_router(api_router)
+# ========================
+# STARTUP
+# ========================
+
+async def ensure_indexes():
+    """Create the indexes backing every hot lookup and sort, item dedup and the classification cache."""
+    await asyncio.gather(
+        db.items.create_index([("url", 1)], unique=True),
+        db.sources.create_index([("id", 1)]),
+        db.sources.create_index([("active", 1)]),
+        db.runs.create_index([("id", 1)]),
+        db.runs.create_index([("started_at", -1)]),
+        db.events.create_index([("run_id", 1)]),
+        db.events.create_index([("created_at", -1)]),
+        db.briefs.create_index([("id", 1)]),
+        db.briefs.create_index([("created_at", -1)]),
+        db.action_items.create_index([("id", 1)]),
+        db.action_items.create_index([("run_id", 1), ("created_at", -1)]),
+        db.action_items.create_index([("status", 1), ("created_at", -1)]),
+        db.approvals.create_index([("id", 1)]),
+        db.approvals.create_index([("run_id", 1), ("created_at", -1)]),
+        db.approvals.create_index([("status", 1), ("created_at", -1)]),
+        db.trend_forecasts.create_index([("run_id", 1), ("created_at", -1)]),
+        db.agentic_insights.create_index([("run_id", 1)]),
+        db.agentic_insights.create_index([("generated_at", -1)]),
+        db.run_logs.create_index([("run_id", 1), ("created_at", 1)]),
+        db.scheduled_runs.create_index([("enabled", 1), ("next_run_at", 1)]),
+        db.source_health.create_index([("source_id", 1), ("checked_at", -1)]),
+        db.classification_cache.create_index([("content_hash", 1)], unique=True),
+        db.classification_cache.create_index(
+            [("created_at", 1)], expireAfterSeconds=CLASSIFICATION_CACHE_TTL_SECONDS
+        ),
+    )
+
+# Timestamps on these collections are BSON dates; documents written before that hold ISO strings
+ACTION_DATE_FIELDS = {
+    "action_items": ("created_at", "completed_at"),
+    "approvals": ("created_at", "approved_at", "executed_at")
+}
+
+async def migrate_action_dates():
+    """Convert legacy ISO-string action item and approval timestamps to BSON dates"""
+    for collection, fields in ACTION_DATE_FIELDS.items():
+        for field in fields:
+            async for doc in db[collection].find({field: {"$type": "string"}}, {"_id": 0, "id": 1, field: 1}):
+                value = datetime.fromisoformat(doc[field].replace('Z', '+00:00'))
+                await db[collection].update_one({"id": doc['id']}, {"$set": {field: value}})
+
+async def backfill_source_health():
+    """Seed the health counters of sources checked before they existed from their source_health history"""
+    missing = [source['id'] async for source in db.sources.find({"health": {"$exists": False}}, {"_id": 0, "id": 1})]
+    if not missing:
+        return
+    
+    ops = []
+    async for totals in db.source_health.aggregate([
+        {"$match": {"source_id": {"$in": missing}}},
+        {"$group": {
+            "_id": "$source_id",
+            "total": {"$sum": 1},
+            "successes": {"$sum": {"$cond": ["$success", 1, 0]}},
+            "sum_response_ms": {"$sum": {"$ifNull": ["$response_time_ms", 0]}},
+            "timed_runs": {"$sum": {"$cond": [{"$gt": [{"$ifNull": ["$response_time_ms", 0]}, 0]}, 1, 0]}},
+            # $max skips nulls; the failure documents compare by their leading checked_at
+            "last_success_at": {"$max": {"$cond": ["$success", "$checked_at", None]}},
+            "last_failure": {"$max": {"$cond": ["$success", None, {"at": "$checked_at", "error": "$error"}]}}
+        }}
+    ]):
+        last_failure = totals.pop('last_failure') or {}
+        health = {k: v for k, v in totals.items() if k != '_id'}
+        health['last_failure_at'] = last_failure.get('at')
+        health['last_error'] = last_failure.get('error')
+        ops.append(UpdateOne({"id": totals['_id'], "health": {"$exists": False}}, {"$set": {"health": health}}))
+    
+    if ops:
+        await db.sources.bulk_write(ops, ordered=False)
+        logger.info(f"Backfilled health counters for {len(ops)} sources")
+
+@app.on_event("startup")
+async def startup_create_indexes():
+    try:
+        await ensure_indexes()
+        logger.info("MongoDB indexes ensured")
+    except Exception as e:
+        logger.error(f"Failed to create MongoDB indexes: {e}")
+
+@app.on_event("startup")
+async def startup_migrate_action_dates():
+    try:
+        await migrate_action_dates()
+    except Exception as e:
+        logger.error(f"Failed to migrate action timestamps: {e}")
+
+@app.on_event("startup")
+async def startup_backfill_source_health():
+    try:
+        await backfill_source_health()
+    except Exception as e:
+        logger.error(f"Failed to backfill source health counters: {e}")
+
+@app.on_event("startup")
+async def startup_token_encoder():
+    # In the background: without network access the download only fails after a timeout
+    app.state.token_encoder_warmup = asyncio.create_task(warm_token_encoder())
+
+@app.on_event("startup")
+async def startup_run_log_flusher():
+    app.state.run_log_flusher = asyncio.create_task(run_log_flusher())
+
+@app.on_event("startup")
+async def startup_pipeline_workers():
+    try:
+        await fail_interrupted_runs()
+    except Exception as e:
+        logger.error(f"Failed to mark interrupted runs: {e}")
+    app.state.pipeline_workers = [asyncio.create_task(pipeline_worker()) for _ in range(PIPELINE_WORKERS)]
+
+@app.on_event("startup")
+async def startup_scheduler():
+    global scheduler_running, scheduler_task
+    scheduler_running = True
+    scheduler_task = asyncio.create_task(check_scheduled_runs())
+
+@app.on_event("shutdown")
+async def shutdown_scheduler():
+    global scheduler_running
+    scheduler_running = False
+    if scheduler_task:
+        scheduler_task.cancel()
+
+@app.on_event("shutdown")
+async def shutdown_pipeline_workers():
+    for worker in app.state.pipeline_workers:
+        worker.cancel()
+
+@app.on_event("shutdown")
+async def shutdown_run_log_flusher():
+    app.state.run_log_flusher.cancel()
+    await flush_run_logs()
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    await http_client.aclose()
 
 # CORS middleware
+cors_origins = [o.strip() for o in os.environ.get('CORS_ORIGINS', '*').split(',') if o.strip()] or ["*"]
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
-    allow_methods=["*"],
+    allow_origins=cors_origins,
+    allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
 )
+
+# Include router
+app.include_router(api_router)
@@ -0,0 +1,29 @@
+import os
+
+import orjson
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+@pytest.fixture(scope="session")
+def session():
+    """Pooled HTTP session shared by every test so calls to the backend reuse connections"""
+    http = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    http.mount("http://", adapter)
+    http.mount("https://", adapter)
+    yield http
+    http.close()
+
+
+@pytest.fixture(scope="session")
+def briefs_list(session):
+    """Brief archive from GET /api/briefs, fetched once and shared by the brief tests"""
+    response = session.get(f"{BASE_URL}/api/briefs")
+    assert response.status_code == 200
+    data = orjson.loads(response.content)
+    assert "briefs" in data
+    return data["briefs"]
@@ -4,18 +4,47 @@ Comprehensive SafarAI Pipeline Testing
 Tests the complete end-to-end functionality as requested in the review.
 """
 
-import requests
+import asyncio
+import httpx
 import json
+import orjson
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import sys
 
+# Sections every brief HTML must contain, matched in one regex pass
+HTML_CHECKS = [
+    ('DOCTYPE html', 'HTML document structure'),
+    ('SafarAI', 'SafarAI branding'),
+    ('Intelligence Brief', 'Brief title'),
+    ('Events', 'Events section'),
+    ('Run Health', 'Pipeline health section')
+]
+HTML_CHECKS_RE = re.compile('|'.join(re.escape(check) for check, _ in HTML_CHECKS))
+
 class SafarAIPipelineTester:
     def __init__(self, base_url="https://stacker.preview.emergentagent.com"):
         self.base_url = base_url
         self.api_url = f"{base_url}/api"
         self.test_results = []
+        self.results_lock = threading.Lock()
+        # Results carry a monotonic offset from this wall-clock start instead of formatting a timestamp each
+        self.started_at = datetime.now()
+        self.started_monotonic = time.monotonic()
         self.run_id = None
+        self.latest_run = None  # Final state of the pipeline run, shared by later categories
+        
+        # One pooled HTTP/2 client so every call to the API host reuses its connection
+        self.client = httpx.Client(
+            base_url=self.api_url,
+            headers={'Content-Type': 'application/json'},
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
         
     def log_test(self, test_name, success, details=""):
         """Log test result"""
@@ -23,24 +52,22 @@ class SafarAIPipelineTester:
         print(f"{status} {test_name}")
         if details:
             print(f"    {details}")
-        self.test_results.append({
-            "test": test_name,
-            "success": success,
-            "details": details,
-            "timestamp": datetime.now().isoformat()
-        })
+        with self.results_lock:
+            self.test_results.append({
+                "test": test_name,
+                "success": success,
+                "details": details,
+                "elapsed_s": time.monotonic() - self.started_monotonic
+            })
         return success
     
     def make_request(self, method, endpoint, data=None, timeout=30):
         """Make API request with error handling"""
-        url = f"{self.api_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=timeout)
+                response = self.client.get(endpoint, timeout=timeout)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=timeout)
+                response = self.client.post(endpoint, json=data, timeout=timeout)
             else:
                 raise ValueError(f"Unsupported method: {method}")
             
@@ -48,6 +75,14 @@ class SafarAIPipelineTester:
         except Exception as e:
             print(f"    Request failed: {str(e)}")
             return None
+    
+    def get_latest_run(self):
+        """Run state recorded by the pipeline test, fetched from runs/latest only when it is missing"""
+        if self.latest_run is None:
+            response = self.make_request('GET', 'runs/latest')
+            if response and response.status_code == 200:
+                self.latest_run = response.json()
+        return self.latest_run
 
     def test_pipeline_execution(self):
         """Test 1: Pipeline Execution Test"""
@@ -69,18 +104,26 @@ class SafarAIPipelineTester:
         # Monitor run status
         print("    Monitoring pipeline execution...")
         max_wait = 120  # 2 minutes max wait
+        poll_interval = 0.5  # Backs off to 5s so short runs are detected quickly
+        last_status_line = None
         start_time = time.time()
         
         while time.time() - start_time < max_wait:
-            response = self.make_request('GET', f'runs/{self.run_id}')
+            # Long-poll: the backend holds the request until the run finishes or the wait expires
+            remaining = max(1, int(max_wait - (time.time() - start_time)))
+            response = self.make_request('GET', f'runs/{self.run_id}?wait={remaining}', timeout=remaining + 10)
             if response and response.status_code == 200:
                 run_data = response.json()
                 status = run_data.get('status', 'unknown')
                 
-                print(f"    Status: {status} | Sources: {run_data.get('sources_ok', 0)}/{run_data.get('sources_total', 0)} | Events: {run_data.get('events_created', 0)}")
+                status_line = f"    Status: {status} | Sources: {run_data.get('sources_ok', 0)}/{run_data.get('sources_total', 0)} | Events: {run_data.get('events_created', 0)}"
+                if status_line != last_status_line:
+                    print(status_line)
+                    last_status_line = status_line
                 
                 if status in ['success', 'partial_failure', 'failure']:
                     # Pipeline completed
+                    self.latest_run = run_data
                     if status == 'success':
                         return self.log_test("Pipeline Execution", True, 
                             f"Pipeline completed successfully. Sources: {run_data.get('sources_ok')}/{run_data.get('sources_total')}, Events: {run_data.get('events_created')}")
@@ -91,7 +134,8 @@ class SafarAIPipelineTester:
                         return self.log_test("Pipeline Execution", False, 
                             f"Pipeline failed. Sources: {run_data.get('sources_ok')}/{run_data.get('sources_total')}")
             
-            time.sleep(5)
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, 5.0)
         
         return self.log_test("Pipeline Execution", False, "Pipeline did not complete within timeout")
 
@@ -115,17 +159,18 @@ class SafarAIPipelineTester:
         
         # Check if sources are being processed in logs
         if self.run_id:
-            response = self.make_request('GET', f'logs/{self.run_id}')
+            # The backend filters the run's logs down to the per-source lines
+            response = self.make_request('GET', f'logs/{self.run_id}?contains=Processing%20source%3A')
             if response and response.status_code == 200:
-                logs_data = response.json()
+                logs_data = orjson.loads(response.content)
                 logs = logs_data.get('logs', [])
                 
-                source_logs = [log for log in logs if 'Processing source:' in log.get('message', '')]
+                source_count = sum(1 for log in logs if 'Processing source:' in log.get('message', ''))
                 
-                if len(source_logs) >= 6:  # Should process at least the default sources
-                    return self.log_test("Sources Processing", True, f"Found {len(source_logs)} source processing logs")
+                if source_count >= 6:  # Should process at least the default sources
+                    return self.log_test("Sources Processing", True, f"Found {source_count} source processing logs")
                 else:
-                    return self.log_test("Sources Processing", False, f"Only found {len(source_logs)} source processing logs")
+                    return self.log_test("Sources Processing", False, f"Only found {source_count} source processing logs")
         
         return self.log_test("Sources Processing", False, "No run ID available to check logs")
 
@@ -134,11 +179,10 @@ class SafarAIPipelineTester:
         print("\n🧠 Testing Content Classification...")
         
         # Check latest run for events
-        response = self.make_request('GET', 'runs/latest')
-        if not response or response.status_code != 200:
+        run_data = self.get_latest_run()
+        if run_data is None:
             return self.log_test("Content Classification", False, "Failed to get latest run")
         
-        run_data = response.json()
         events_created = run_data.get('events_created', 0)
         items_total = run_data.get('items_total', 0)
         
@@ -161,7 +205,7 @@ class SafarAIPipelineTester:
         if not response or response.status_code != 200:
             return self.log_test("Brief Generation", False, "Failed to get latest brief")
         
-        brief_data = response.json()
+        brief_data = orjson.loads(response.content)
         
         if 'message' in brief_data and 'No briefs available' in brief_data['message']:
             return self.log_test("Brief Generation", False, "No briefs available")
@@ -180,16 +224,9 @@ class SafarAIPipelineTester:
             return self.log_test("Brief HTML", False, "Brief HTML is empty")
         
         # Verify HTML contains expected elements
-        html_checks = [
-            ('DOCTYPE html', 'HTML document structure'),
-            ('SafarAI', 'SafarAI branding'),
-            ('Intelligence Brief', 'Brief title'),
-            ('Events', 'Events section'),
-            ('Run Health', 'Pipeline health section')
-        ]
-        
-        for check, description in html_checks:
-            if check not in html_content:
+        found = set(HTML_CHECKS_RE.findall(html_content))
+        for check, description in HTML_CHECKS:
+            if check not in found:
                 return self.log_test("Brief HTML Content", False, f"Missing {description}")
         
         self.log_test("Brief HTML Content", True, "HTML contains all expected sections")
@@ -205,7 +242,7 @@ class SafarAIPipelineTester:
             summary = event.get('summary', '')
             
             # Check for emoji (basic check for common emoji ranges)
-            emoji_found = any(ord(char) > 127 for char in title + summary)
+            emoji_found = not (title.isascii() and summary.isascii())
             if emoji_found:
                 return self.log_test("Brief Event Format", False, "Events contain emoji characters")
         
@@ -216,11 +253,10 @@ class SafarAIPipelineTester:
         print("\n📬 Testing Email Delivery...")
         
         # Check latest run for email status
-        response = self.make_request('GET', 'runs/latest')
-        if not response or response.status_code != 200:
+        run_data = self.get_latest_run()
+        if run_data is None:
             return self.log_test("Email Delivery Check", False, "Failed to get latest run")
         
-        run_data = response.json()
         emails_sent = run_data.get('emails_sent', 0)
         
         if emails_sent == 0:
@@ -244,9 +280,21 @@ class SafarAIPipelineTester:
             ('GET', 'brief/latest', 'Latest Brief')
         ]
         
+        async def fetch_all():
+            # All checks run concurrently as streams over one HTTP/2 connection
+            async with httpx.AsyncClient(base_url=self.api_url, http2=True, timeout=30.0) as client:
+                async def fetch(method, endpoint):
+                    try:
+                        return await client.request(method, endpoint)
+                    except Exception as e:
+                        print(f"    Request failed: {str(e)}")
+                        return None
+                return await asyncio.gather(*[fetch(method, endpoint) for method, endpoint, _ in health_tests])
+        
+        responses = asyncio.run(fetch_all())
+        
         all_passed = True
-        for method, endpoint, description in health_tests:
-            response = self.make_request(method, endpoint)
+        for (method, endpoint, description), response in zip(health_tests, responses):
             if not response or response.status_code != 200:
                 self.log_test(f"Health Check: {description}", False, f"Endpoint /{endpoint} failed")
                 all_passed = False
@@ -263,18 +311,27 @@ class SafarAIPipelineTester:
         if self.run_id:
             response = self.make_request('GET', f'logs/{self.run_id}')
             if response and response.status_code == 200:
-                logs_data = response.json()
+                logs_data = orjson.loads(response.content)
                 logs = logs_data.get('logs', [])
                 
-                error_logs = [log for log in logs if log.get('level') == 'error']
-                warn_logs = [log for log in logs if log.get('level') == 'warn']
+                # One pass: count by level and keep only the error messages that get reported
+                error_count = 0
+                warn_count = 0
+                error_messages = []
+                for log in logs:
+                    level = log.get('level')
+                    if level == 'error':
+                        error_count += 1
+                        if len(error_messages) < 3:
+                            error_messages.append(log.get('message', ''))
+                    elif level == 'warn':
+                        warn_count += 1
                 
-                if error_logs:
-                    error_messages = [log.get('message', '') for log in error_logs]
-                    return self.log_test("Error Handling", False, f"Found {len(error_logs)} errors: {error_messages[:3]}")
+                if error_count:
+                    return self.log_test("Error Handling", False, f"Found {error_count} errors: {error_messages}")
                 
-                if warn_logs:
-                    self.log_test("Warning Handling", True, f"Found {len(warn_logs)} warnings (handled gracefully)")
+                if warn_count:
+                    self.log_test("Warning Handling", True, f"Found {warn_count} warnings (handled gracefully)")
                 
                 return self.log_test("Error Handling", True, "No critical errors found in logs")
         
@@ -285,30 +342,40 @@ class SafarAIPipelineTester:
         print("🚀 Starting Comprehensive SafarAI Pipeline Testing...")
         print("=" * 80)
         
-        tests = [
+        # The first categories run in order: later ones read the run_id the pipeline test sets
+        sequential_tests = [
             self.test_pipeline_execution,
             self.test_active_sources_crawling,
-            self.test_content_classification,
+            self.test_content_classification
+        ]
+        # Independent of each other once the run has finished
+        concurrent_tests = [
             self.test_email_brief_generation,
             self.test_email_delivery,
             self.test_api_health_checks,
             self.test_error_handling
         ]
         
-        passed = 0
-        total = 0
-        
-        for test_func in tests:
+        def run_category(test_func):
             try:
-                if test_func():
-                    passed += 1
-                total += 1
+                return bool(test_func())
             except Exception as e:
                 print(f"❌ Test {test_func.__name__} failed with exception: {e}")
-                total += 1
+                return False
+        
+        try:
+            outcomes = [run_category(test_func) for test_func in sequential_tests]
+            with ThreadPoolExecutor(max_workers=len(concurrent_tests)) as executor:
+                outcomes.extend(executor.map(run_category, concurrent_tests))
+        finally:
+            self.client.close()
+        
+        passed = sum(outcomes)
+        total = len(outcomes)
         
         # Summary
         print("\n" + "=" * 80)
+        print(f"🕒 Started at {self.started_at.isoformat()}, elapsed_s values are relative to it")
         print(f"📊 Comprehensive Test Results: {passed}/{total} test categories passed")
         
         detailed_results = sum(1 for r in self.test_results if r['success'])
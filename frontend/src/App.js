@@ -344,7 +344,7 @@ const Dashboard = () => {
     try {
       const response = await axios.get(`${API}/stats`);
       setStats(response.data);
-      setIsRunning(response.data.latest_run?.status === "running");
+      setIsRunning(["queued", "running"].includes(response.data.latest_run?.status));
     } catch (e) {
       console.error("Failed to fetch stats:", e);
     } finally {
@@ -878,7 +878,7 @@ const Runs = () => {
               <div className="w-14 h-14 rounded-2xl bg-white flex items-center justify-center">
                 {run.status === 'success' ? (
                   <CheckCircle2 size={28} className="text-black" />
-                ) : run.status === 'running' ? (
+                ) : run.status === 'running' || run.status === 'queued' ? (
                   <Loader2 size={28} className="text-black animate-spin" />
                 ) : (
                   <AlertTriangle size={28} className="text-black" />